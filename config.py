@@ -43,11 +43,20 @@ class Config:
         if not self.zaram_pass_path:
             raise ValueError("ZARAM_PASS_PATH must be set in environment")
         
+        # Local port forwarded to the ONT's telnet port over the router SSH connection.
+        # 0 keeps the default of running RouterOS's own telnet client inside the SSH session.
+        self.zaram_ont_tunnel_port = int(os.getenv('ZARAM_ONT_TUNNEL_PORT', '0'))
+        
+        # Size of each read from the ONT session (pexpect defaults to 2000 bytes);
+        # larger reads pull multi-KB command output in fewer syscalls
+        self.ont_read_buffer_bytes = int(os.getenv('ONT_READ_BUFFER_BYTES', '65536'))
+        
         # Monitoring Configuration
         monitored_interfaces = os.getenv('MONITORED_INTERFACES')
         if not monitored_interfaces:
             raise ValueError("MONITORED_INTERFACES must be set in environment")
-        self.monitored_interfaces = monitored_interfaces.split(',')
+        # Immutable and ordered: the ONT collector reports under the first entry
+        self.monitored_interfaces = tuple(monitored_interfaces.split(','))
         
         collection_interval = os.getenv('COLLECTION_INTERVAL_SECONDS')
         if not collection_interval:
@@ -63,6 +72,17 @@ class Config:
         if not self.metrics_host:
             raise ValueError("METRICS_HOST must be set in environment")
         
+        # Reuse an SFP monitor reading this young instead of POSTing again (the
+        # monitor call blocks ~1s on the router). This only pays off when SFP
+        # collections run closer together than this, e.g. a collect_sfp_metrics()
+        # call right after a full cycle or a very short COLLECTION_INTERVAL_SECONDS;
+        # at the default 30s interval it never hits. Kept short so a reading is
+        # never reported as current for longer than a few seconds.
+        self.sfp_monitor_cache_seconds = float(os.getenv('SFP_MONITOR_CACHE_SECONDS', '4'))
+        # OLT vendor/version hardly ever change: the only OLT polling cadence. Each
+        # ONT cycle includes 'onu dump ptp' once the last good reading is this old
+        self.olt_vendor_cache_seconds = float(os.getenv('OLT_VENDOR_CACHE_SECONDS', '300'))
+        
         # Logging Configuration
         self.log_level = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper())  # keeping INFO as safe default
         
@@ -237,6 +257,8 @@ class Config:
         logging.info(f"RouterOS Host: {self.routeros_host}")
         logging.info(f"RouterOS User: {self.routeros_user}")
         logging.info(f"Zaram ONT IP: {self.zaram_ont_ip}")
+        logging.info(f"Zaram ONT Tunnel Port: {self.zaram_ont_tunnel_port or 'disabled'}")
+        logging.info(f"ONT Read Buffer: {self.ont_read_buffer_bytes} bytes")
         logging.info(f"Zaram ONT User: {self.zaram_ont_user}")
         logging.info(f"Monitored Interfaces: {', '.join(self.monitored_interfaces)}")
         logging.info(f"Collection Interval: {self.collection_interval_seconds}s")
@@ -246,6 +268,8 @@ class Config:
         logging.info(f"SSH Timeout: {self.ssh_timeout_seconds}s")
         logging.info(f"Telnet Timeout: {self.telnet_timeout_seconds}s")
         logging.info(f"Stale Data Threshold: {self.stale_data_threshold_dbm} dBm")
+        logging.info(f"SFP Monitor Cache: {self.sfp_monitor_cache_seconds}s")
+        logging.info(f"OLT Vendor Interval: {self.olt_vendor_cache_seconds}s")
         logging.info("=====================")
 
     def enable_debug_logging(self):
@@ -3,6 +3,7 @@
 import logging
 import logging.handlers
 import time
+from concurrent.futures import ThreadPoolExecutor
 from prometheus_client import start_http_server
 from config import config
 from metrics_registry import log_metrics_summary
@@ -40,13 +41,15 @@ def main():
     # Initialize collectors
     routeros_collector = RouterOSCollector()
     zaram_ont_collector = ZaramONTCollector()
+    # The RouterOS REST calls and the ONT SSH session are independent I/O, so run them side by side
+    collector_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='collector')
 
-    # Timer variables for different collection intervals
+    # Timer variable for the collection interval
     last_regular_collection = 0
-    last_olt_vendor_collection = 0
-    olt_vendor_interval = 300  # 5 minutes (300 seconds)
     
-    logging.info(f"Starting collection with regular interval: {config.collection_interval_seconds}s, OLT vendor interval: {olt_vendor_interval}s")
+    # The ONT collector decides itself when the OLT vendor info is due again
+    # (OLT_VENDOR_CACHE_SECONDS) and adds it to that cycle's ONT batch
+    logging.info(f"Starting collection with regular interval: {config.collection_interval_seconds}s, OLT vendor interval: {config.olt_vendor_cache_seconds:.0f}s")
 
     # Main collection loop
     while True:
@@ -56,20 +59,18 @@ def main():
             # Check if it's time for regular collection (every 30 seconds)
             if current_time - last_regular_collection >= config.collection_interval_seconds:
                 logging.info("Starting regular metrics collection cycle...")
-                routeros_collector.collect_all_metrics()
-                zaram_ont_collector.collect_regular_metrics()
+                futures = [
+                    collector_pool.submit(routeros_collector.collect_all_metrics),
+                    collector_pool.submit(zaram_ont_collector.collect_all_metrics),
+                ]
+                for future in futures:
+                    future.result()
                 last_regular_collection = current_time
                 
                 # Only log metrics summary in debug mode
                 if config.debug_logging:
                     log_metrics_summary()
             
-            # Check if it's time for OLT vendor collection (every 5 minutes)
-            if current_time - last_olt_vendor_collection >= olt_vendor_interval:
-                logging.info("Starting OLT vendor collection cycle...")
-                zaram_ont_collector.collect_olt_vendor_info()
-                last_olt_vendor_collection = current_time
-            
             # Sleep for a short interval to avoid busy waiting
             time.sleep(1)
             
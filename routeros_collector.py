@@ -2,11 +2,16 @@
 
 import json
 import logging
+import threading
 import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 from config import config
 from metrics_registry import routeros_metrics, collection_metrics
@@ -15,17 +20,101 @@ from metrics_registry import routeros_metrics, collection_metrics
 requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
 
+# Interface statistic fields mapped to their metrics
+_STATS_MAPPING = (
+    ('rx-byte', routeros_metrics.interface_rx_bytes),
+    ('tx-byte', routeros_metrics.interface_tx_bytes),
+    ('rx-packet', routeros_metrics.interface_rx_packets),
+    ('tx-packet', routeros_metrics.interface_tx_packets),
+    ('rx-error', routeros_metrics.interface_rx_errors),
+    ('tx-error', routeros_metrics.interface_tx_errors),
+    ('rx-drop', routeros_metrics.interface_rx_drops),
+    ('tx-drop', routeros_metrics.interface_tx_drops),
+    ('tx-queue-drop', routeros_metrics.interface_tx_queue_drops),
+)
+
+# SFP monitor error statistic fields mapped to their metrics
+_SFP_ERROR_MAPPING = (
+    ('sfp-tx-fcs-error', routeros_metrics.sfp_tx_fcs_error),
+    ('sfp-tx-collision', routeros_metrics.sfp_tx_collision),
+    ('sfp-tx-excessive-collision', routeros_metrics.sfp_tx_excessive_collision),
+    ('sfp-tx-late-collision', routeros_metrics.sfp_tx_late_collision),
+    ('sfp-tx-deferred', routeros_metrics.sfp_tx_deferred),
+    ('sfp-rx-too-short', routeros_metrics.sfp_rx_too_short),
+    ('sfp-rx-too-long', routeros_metrics.sfp_rx_too_long),
+    ('sfp-rx-jabber', routeros_metrics.sfp_rx_jabber),
+    ('sfp-rx-fcs-error', routeros_metrics.sfp_rx_fcs_error),
+    ('sfp-rx-align-error', routeros_metrics.sfp_rx_align_error),
+    ('sfp-rx-fragment', routeros_metrics.sfp_rx_fragment),
+    ('sfp-rx-overflow', routeros_metrics.sfp_rx_overflow),
+    ('sfp-tx-underrun', routeros_metrics.sfp_tx_underrun),
+)
+
+# SFP optical power fields as (field, metric, stale metric_type label, log label)
+_OPTICAL_POWER_FIELDS = (
+    ('sfp-rx-power', routeros_metrics.sfp_rx_power, 'rx_power', 'RX'),
+    ('sfp-tx-power', routeros_metrics.sfp_tx_power, 'tx_power', 'TX'),
+)
+
+# Interface fields read by the collector; requested via .proplist so the
+# heaviest response of a cycle carries only what gets parsed
+_INTERFACE_PROPLIST = ','.join(
+    ('.id', 'name', 'running', 'link-downs', 'last-link-up-time', 'last-link-down-time')
+    + tuple(stat for stat, _ in _STATS_MAPPING)
+)
+
+
+def _parse_suffixed(value: Any, suffix: str) -> float:
+    """Parse a numeric RouterOS field, dropping a trailing unit such as 'C' or 'dBm'"""
+    s = value if isinstance(value, str) else str(value)
+    return float(s[:-len(suffix)] if s.endswith(suffix) else s)
+
+
+def _parse_ros_ts(s: str) -> float:
+    """Parse a RouterOS 'YYYY-MM-DD HH:MM:SS' timestamp into epoch seconds"""
+    if len(s) != 19 or s[4] != '-' or s[7] != '-' or s[10] != ' ':
+        raise ValueError(f"unexpected timestamp format: {s!r}")
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19])).timestamp()
+
+
 class RouterOSCollector:
     """Collector for RouterOS API metrics"""
     
     def __init__(self):
         self.session = requests.Session()
         self.session.verify = False
+        
+        # Keep-alive pool sized for the concurrent calls of a cycle, with a
+        # small retry budget for transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Worker threads used to overlap the independent REST calls of a cycle
+        self.executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='routeros-api')
+        # Password is fetched lazily on the first request
         self.api_password = None
-        self._refresh_password()
+        self._password_lock = threading.Lock()
         
         # SFP vendor serial number tracking
         self.last_sfp_vendor_serial = None
+        
+        # Interface list cache as (monotonic fetch time, interfaces)
+        self._interface_cache: Optional[Tuple[float, List[Dict]]] = None
+        
+        # Labelled metric children keyed by (id(metric), interface name)
+        self._child_cache: Dict[Tuple[int, str], Any] = {}
+        
+        # Parsed link up/down timestamps keyed by "<interface>:<up|down>:<raw>"
+        self._ts_cache: Dict[str, float] = {}
+        
+        # Last SFP monitor result as (monotonic fetch time, data)
+        self._sfp_mon_cache: Optional[Tuple[float, Dict]] = None
     
     def _refresh_password(self):
         """Refresh the API password"""
@@ -33,85 +122,122 @@ class RouterOSCollector:
         if not self.api_password:
             logging.error("Failed to get RouterOS API password")
             raise ValueError("RouterOS API password not available")
+        self.session.auth = (config.routeros_user, self.api_password)
     
     def _make_request(self, endpoint: str, method: str = 'GET', data: Optional[Dict] = None, params: Optional[Dict] = None) -> Optional[Any]:
         """Make a request to the RouterOS API"""
         try:
-            # Refresh password if needed
+            # Fetch password on first use; the lock keeps concurrent calls from
+            # each running the password lookup
             if not self.api_password:
-                self._refresh_password()
+                with self._password_lock:
+                    if not self.api_password:
+                        self._refresh_password()
             
             url = f"{config.routeros_api_protocol}://{config.routeros_host}/rest/{endpoint}"
             
-            if method.upper() == 'GET':
-                response = self.session.get(url, auth=(config.routeros_user, self.api_password), params=params, timeout=config.api_timeout_seconds)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, auth=(config.routeros_user, self.api_password), json=data, timeout=config.api_timeout_seconds)
-            else:
-                logging.error(f"Unsupported HTTP method: {method}")
+            verb = method.upper()
+            send = {'GET': self.session.get, 'POST': self.session.post}.get(verb)
+            if send is None:
+                logging.error("Unsupported HTTP method: %s", method)
                 return None
             
+            kwargs: Dict[str, Any] = {'timeout': config.api_timeout_seconds}
+            if verb == 'GET':
+                kwargs['params'] = params
+            else:
+                kwargs['json'] = data
+            
+            response = send(url, **kwargs)
+            
             if response.status_code == 401:
                 logging.warning("Authentication failed, refreshing password")
-                self._refresh_password()
+                with self._password_lock:
+                    self._refresh_password()
                 # Retry once with new password
-                if method.upper() == 'GET':
-                    response = self.session.get(url, auth=(config.routeros_user, self.api_password), params=params, timeout=config.api_timeout_seconds)
-                else:
-                    response = self.session.post(url, auth=(config.routeros_user, self.api_password), json=data, timeout=config.api_timeout_seconds)
+                response = send(url, **kwargs)
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logging.error(f"API request failed: {response.status_code} - {response.text}")
+            if response.status_code != 200:
+                logging.error("API request failed: %s - %s", response.status_code, response.text)
                 return None
+            
+            return orjson.loads(response.content)
                 
         except requests.exceptions.Timeout:
-            logging.error(f"API request timeout for endpoint: {endpoint}")
+            logging.error("API request timeout for endpoint: %s", endpoint)
             collection_metrics.collection_errors_total.labels(collector_type='routeros', error_type='timeout').inc()
             return None
         except requests.exceptions.RequestException as e:
-            logging.error(f"API request error for endpoint {endpoint}: {e}")
+            logging.error("API request error for endpoint %s: %s", endpoint, e)
             collection_metrics.collection_errors_total.labels(collector_type='routeros', error_type='request_error').inc()
             return None
         except Exception as e:
-            logging.error(f"Unexpected error in API request for endpoint {endpoint}: {e}")
+            logging.error("Unexpected error in API request for endpoint %s: %s", endpoint, e)
             collection_metrics.collection_errors_total.labels(collector_type='routeros', error_type='unexpected').inc()
             return None
     
-    def collect_interface_metrics(self) -> bool:
-        """Collect interface metrics from RouterOS"""
-        start_time = time.time()
+    def _child(self, metric: Any, name: str) -> Any:
+        """Get the interface-labelled child of a metric, cached across scrapes"""
+        key = (id(metric), name)
+        child = self._child_cache.get(key)
+        if child is None:
+            child = self._child_cache[key] = metric.labels(interface_name=name)
+        return child
+    
+    def _get_interfaces(self, max_age: float = 5.0) -> Optional[List[Dict]]:
+        """Get the interface list, reusing a fetch younger than max_age seconds"""
+        if self._interface_cache is not None:
+            fetched_at, interfaces = self._interface_cache
+            if time.monotonic() - fetched_at < max_age:
+                return interfaces
+        
+        interfaces = self._make_request('interface', params={'.proplist': _INTERFACE_PROPLIST})
+        if interfaces:
+            self._interface_cache = (time.monotonic(), interfaces)
+        return interfaces
+    
+    def collect_interface_metrics(self, interfaces: Optional[List[Dict]] = None, pppoe_interfaces: Optional[List[Dict]] = None, record_metrics: bool = True) -> bool:
+        """Collect interface metrics from RouterOS
+        
+        Args:
+            interfaces: Pre-fetched interface list, fetched from the API when None
+            pppoe_interfaces: Pre-fetched PPPoE client list, fetched from the API when None
+            record_metrics: Update the collection duration/success metrics, disabled
+                when the caller records them for the whole cycle
+        """
+        start_time = time.monotonic()
         success = False
         
         try:
             logging.info("Collecting RouterOS interface metrics...")
             
             # Get interface list
-            interfaces = self._make_request('interface')
+            if interfaces is None:
+                interfaces = self._get_interfaces()
             if not interfaces:
                 logging.error("No interfaces returned from RouterOS")
                 return False
             
             # Get PPPoE interfaces
-            pppoe_interfaces = self._make_request('interface/pppoe-client')
+            if pppoe_interfaces is None:
+                pppoe_interfaces = self._make_request('interface/pppoe-client')
             pppoe_status = {}
             if pppoe_interfaces:
                 for pppoe in pppoe_interfaces:
                     pppoe_name = pppoe.get('name')
                     if pppoe_name == 'pppoe-wan':
                         pppoe_status[pppoe_name] = pppoe.get('status', 'disconnected')
-                        logging.info(f"PPPoE interface: {pppoe_name} (status: {pppoe_status[pppoe_name]})")
+                        logging.debug("PPPoE interface: %s (status: %s)", pppoe_name, pppoe_status[pppoe_name])
             
-            # Process monitored interfaces
-            for iface in interfaces:
-                name = iface.get('name', '')
-                
-                # Only process configured interfaces
-                if name not in config.monitored_interfaces:
+            # Process monitored interfaces, looked up by name instead of scanning
+            # the full interface list for each one
+            by_name = {i.get('name', ''): i for i in interfaces}
+            for name in config.monitored_interfaces:
+                iface = by_name.get(name)
+                if iface is None:
                     continue
                     
-                logging.info(f"Processing RouterOS interface: {name}")
+                logging.debug("Processing RouterOS interface: %s", name)
                 
                 # Handle PPPoE interface
                 if name == 'pppoe-wan':
@@ -120,17 +246,17 @@ class RouterOSCollector:
                     running = iface.get('running') == 'true' if isinstance(iface.get('running'), str) else bool(iface.get('running', False))
                 
                 # Update link status
-                routeros_metrics.interface_link_status.labels(interface_name=name).set(1 if running else 0)
-                logging.info(f"Interface {name} running state: {running}")
+                self._child(routeros_metrics.interface_link_status, name).set(1 if running else 0)
+                logging.debug("Interface %s running state: %s", name, running)
                 
                 # Update link down counter
                 if 'link-downs' in iface:
                     try:
                         link_downs = float(iface['link-downs'])
-                        routeros_metrics.interface_link_downs.labels(interface_name=name).set(link_downs)
-                        logging.info(f"Interface {name} link-downs: {link_downs}")
+                        self._child(routeros_metrics.interface_link_downs, name).set(link_downs)
+                        logging.debug("Interface %s link-downs: %s", name, link_downs)
                     except (ValueError, TypeError) as e:
-                        logging.error(f"Error converting link-downs value for {name}: {e}")
+                        logging.error("Error converting link-downs value for %s: %s", name, e)
                 
                 # Update last link up/down timestamps
                 self._update_link_timestamps(iface, name)
@@ -142,82 +268,114 @@ class RouterOSCollector:
             logging.info("RouterOS interface metrics collection completed successfully")
             
         except Exception as e:
-            logging.error(f"Error collecting RouterOS interface metrics: {e}")
+            logging.error("Error collecting RouterOS interface metrics: %s", e)
             collection_metrics.collection_errors_total.labels(collector_type='routeros', error_type='interface_collection').inc()
         
         finally:
-            # Update collection metrics
-            duration = time.time() - start_time
-            collection_metrics.collection_duration_seconds.labels(collector_type='routeros').set(duration)
-            collection_metrics.collection_success.labels(collector_type='routeros').set(1 if success else 0)
-            if success:
-                collection_metrics.last_collection_timestamp.labels(collector_type='routeros').set(time.time())
+            if record_metrics:
+                self._record_collection(time.monotonic() - start_time, success)
         
         return success
     
-    def collect_sfp_metrics(self) -> bool:
-        """Collect SFP-specific metrics from RouterOS"""
-        start_time = time.time()
+    def collect_sfp_metrics(self, interfaces: Optional[List[Dict]] = None, sfp_data: Optional[Dict] = None, record_metrics: bool = True) -> bool:
+        """Collect SFP-specific metrics from RouterOS
+        
+        Args:
+            interfaces: Pre-fetched interface list, fetched from the API when None
+            sfp_data: Pre-fetched SFP monitor data, fetched from the API when None
+            record_metrics: Update the collection duration/success metrics, disabled
+                when the caller records them for the whole cycle
+        """
+        start_time = time.monotonic()
         success = False
         
         try:
             logging.info("Collecting RouterOS SFP metrics...")
             
             # Get interface list
-            interfaces = self._make_request('interface')
+            if interfaces is None:
+                interfaces = self._get_interfaces()
             if not interfaces:
                 logging.error("No interfaces returned from RouterOS")
                 return False
             
-            # Process SFP interface
-            for iface in interfaces:
-                name = iface.get('name', '')
-                if name != 'sfp-sfpplus1':
-                    continue
-                
-                logging.info(f"Processing RouterOS SFP metrics for interface: {name}")
-                iface_id = iface.get('.id', '')
-                
-                # Get SFP monitor data
-                sfp_data = self._make_request('interface/ethernet/monitor', 
-                                            method='POST',
-                                            data={'numbers': iface_id, 'duration': '1s'})
-                
-                if not sfp_data:
-                    logging.warning("No SFP monitor data received")
-                    continue
-                
-                # Handle case where we get a list of interfaces
-                if isinstance(sfp_data, list):
-                    if not sfp_data:
-                        logging.warning("Empty list of interfaces received")
-                        continue
-                    sfp_data = next((iface for iface in sfp_data 
-                                   if iface.get('name') == name), sfp_data[0])
-                
-                # Process SFP metrics
-                self._process_sfp_metrics(sfp_data, name)
-                
-                # Get detailed SFP error statistics
-                self._collect_sfp_error_stats(iface_id, name)
+            # Find the SFP interface
+            name = 'sfp-sfpplus1'
+            sfp_iface = next((i for i in interfaces if i.get('name') == name), None)
+            if sfp_iface is None:
+                logging.warning("SFP interface %s not found on RouterOS", name)
+                return False
+            
+            logging.debug("Processing RouterOS SFP metrics for interface: %s", name)
+            
+            # Get SFP monitor data
+            if sfp_data is None:
+                sfp_data = self._fetch_sfp_monitor(sfp_iface.get('.id', ''), name)
+            
+            if not sfp_data:
+                logging.warning("No SFP monitor data received")
+                return False
+            
+            # Process SFP metrics
+            self._process_sfp_metrics(sfp_data, name)
+            
+            # Get detailed SFP error statistics from the same monitor response
+            self._collect_sfp_error_stats(sfp_data, name)
             
             success = True
             logging.info("RouterOS SFP metrics collection completed successfully")
             
         except Exception as e:
-            logging.error(f"Error collecting RouterOS SFP metrics: {e}")
+            logging.error("Error collecting RouterOS SFP metrics: %s", e)
             collection_metrics.collection_errors_total.labels(collector_type='routeros', error_type='sfp_collection').inc()
         
         finally:
-            # Update collection metrics
-            duration = time.time() - start_time
-            collection_metrics.collection_duration_seconds.labels(collector_type='routeros').set(duration)
-            collection_metrics.collection_success.labels(collector_type='routeros').set(1 if success else 0)
-            if success:
-                collection_metrics.last_collection_timestamp.labels(collector_type='routeros').set(time.time())
+            if record_metrics:
+                self._record_collection(time.monotonic() - start_time, success)
         
         return success
     
+    def _future_result(self, future, description: str) -> Any:
+        """Return the result of a concurrent fetch, or None (logged and counted) if it raised"""
+        try:
+            return future.result()
+        except Exception as e:
+            logging.error("Error fetching %s: %s", description, e)
+            collection_metrics.collection_errors_total.labels(collector_type='routeros', error_type='request_error').inc()
+            return None
+    
+    def _record_collection(self, duration: float, success: bool):
+        """Update the RouterOS collection duration, success and timestamp metrics"""
+        collection_metrics.collection_duration_seconds.labels(collector_type='routeros').set(duration)
+        collection_metrics.collection_success.labels(collector_type='routeros').set(1 if success else 0)
+        if success:
+            collection_metrics.last_collection_timestamp.labels(collector_type='routeros').set(time.time())
+    
+    def _fetch_sfp_monitor(self, numbers: str, name: str) -> Optional[Dict]:
+        """Fetch SFP monitor data for an interface, addressed by .id or name"""
+        # The monitor call blocks for its full duration on the router, so reuse
+        # a recent result when cycles run close together
+        if self._sfp_mon_cache is not None:
+            fetched_at, cached = self._sfp_mon_cache
+            if time.monotonic() - fetched_at < config.sfp_monitor_cache_seconds:
+                return cached
+        
+        sfp_data = self._make_request('interface/ethernet/monitor', 
+                                      method='POST',
+                                      data={'numbers': numbers, 'duration': '1s'})
+        
+        # Handle case where we get a list of interfaces
+        if isinstance(sfp_data, list):
+            if not sfp_data:
+                logging.warning("Empty list of interfaces received")
+                return None
+            sfp_data = next((iface for iface in sfp_data 
+                           if iface.get('name') == name), sfp_data[0])
+        
+        if sfp_data:
+            self._sfp_mon_cache = (time.monotonic(), sfp_data)
+        return sfp_data
+    
     def _get_pppoe_status(self, pppoe_interfaces: List[Dict], interface_name: str) -> bool:
         """Get PPPoE interface status"""
         if not pppoe_interfaces:
@@ -226,7 +384,7 @@ class RouterOSCollector:
         
         pppoe_client = next((p for p in pppoe_interfaces if p.get('name') == interface_name), None)
         if not pppoe_client:
-            logging.warning(f"No PPPoE client found for interface {interface_name}")
+            logging.warning("No PPPoE client found for interface %s", interface_name)
             return False
         
         is_running = pppoe_client.get('running', '').lower() == 'true'
@@ -235,50 +393,49 @@ class RouterOSCollector:
         # RouterOS PPPoE client API doesn't provide a separate 'status' field
         # The 'running' field is sufficient to determine if the PPPoE connection is active
         running = is_running
-        logging.info(f"PPPoE interface {interface_name} - running: {is_running}, final status: {'UP' if running else 'DOWN'}")
+        logging.debug("PPPoE interface %s - running: %s, final status: %s", interface_name, is_running, 'UP' if running else 'DOWN')
         
         return running
     
+    def _parse_link_ts(self, name: str, direction: str, raw: str) -> float:
+        """Parse a link timestamp, reusing the result while the raw value is unchanged"""
+        key = f"{name}:{direction}:{raw}"
+        value = self._ts_cache.get(key)
+        if value is None:
+            # Values only change on link events, so a tiny cache is plenty
+            if len(self._ts_cache) > 32:
+                self._ts_cache.clear()
+            value = self._ts_cache[key] = _parse_ros_ts(raw)
+        return value
+    
     def _update_link_timestamps(self, iface: Dict, name: str):
         """Update link up/down timestamps"""
         if 'last-link-up-time' in iface:
             try:
-                last_up = datetime.strptime(iface['last-link-up-time'], '%Y-%m-%d %H:%M:%S')
-                routeros_metrics.interface_last_link_up.labels(interface_name=name).set(last_up.timestamp())
-                logging.info(f"Interface {name} last link up: {iface['last-link-up-time']}")
+                last_up = self._parse_link_ts(name, 'up', iface['last-link-up-time'])
+                self._child(routeros_metrics.interface_last_link_up, name).set(last_up)
+                logging.debug("Interface %s last link up: %s", name, iface['last-link-up-time'])
             except Exception as e:
-                logging.error(f"Error parsing last-link-up-time for {name}: {e}")
+                logging.error("Error parsing last-link-up-time for %s: %s", name, e)
                 
         if 'last-link-down-time' in iface:
             try:
-                last_down = datetime.strptime(iface['last-link-down-time'], '%Y-%m-%d %H:%M:%S')
-                routeros_metrics.interface_last_link_down.labels(interface_name=name).set(last_down.timestamp())
-                logging.info(f"Interface {name} last link down: {iface['last-link-down-time']}")
+                last_down = self._parse_link_ts(name, 'down', iface['last-link-down-time'])
+                self._child(routeros_metrics.interface_last_link_down, name).set(last_down)
+                logging.debug("Interface %s last link down: %s", name, iface['last-link-down-time'])
             except Exception as e:
-                logging.error(f"Error parsing last-link-down-time for {name}: {e}")
+                logging.error("Error parsing last-link-down-time for %s: %s", name, e)
     
     def _update_interface_stats(self, iface: Dict, name: str):
         """Update interface statistics"""
-        stats_mapping = [
-            ('rx-byte', routeros_metrics.interface_rx_bytes),
-            ('tx-byte', routeros_metrics.interface_tx_bytes),
-            ('rx-packet', routeros_metrics.interface_rx_packets),
-            ('tx-packet', routeros_metrics.interface_tx_packets),
-            ('rx-error', routeros_metrics.interface_rx_errors),
-            ('tx-error', routeros_metrics.interface_tx_errors),
-            ('rx-drop', routeros_metrics.interface_rx_drops),
-            ('tx-drop', routeros_metrics.interface_tx_drops),
-            ('tx-queue-drop', routeros_metrics.interface_tx_queue_drops)
-        ]
-        
-        for stat, metric in stats_mapping:
+        for stat, metric in _STATS_MAPPING:
             if stat in iface:
                 try:
                     value = float(iface[stat])
-                    metric.labels(interface_name=name)._value.set(value)
-                    logging.debug(f"Updated {name} {stat}: {value}")
+                    self._child(metric, name)._value.set(value)
+                    logging.debug("Updated %s %s: %s", name, stat, value)
                 except (ValueError, TypeError) as e:
-                    logging.error(f"Error updating {name} {stat}: {e}")
+                    logging.error("Error updating %s %s: %s", name, stat, e)
     
     def _process_sfp_metrics(self, sfp_data: Dict, name: str):
         """Process SFP module metrics"""
@@ -289,46 +446,37 @@ class RouterOSCollector:
         sfp_status = sfp_data.get('status', 'down').lower()
         link_is_up = sfp_status == 'link-ok'
         
-        logging.info(f"SFP interface {name} - SFP monitor status: {sfp_status}, final link_is_up: {link_is_up}")
+        logging.debug("SFP interface %s - SFP monitor status: %s, final link_is_up: %s", name, sfp_status, link_is_up)
         
         # Process temperature
         if 'sfp-temperature' in sfp_data:
             temp_str = sfp_data['sfp-temperature']
             try:
-                if isinstance(temp_str, str) and 'C' in temp_str:
-                    temp = float(temp_str.rstrip('C'))
-                else:
-                    temp = float(temp_str)
-                routeros_metrics.sfp_temperature.labels(interface_name=name).set(temp)
-                logging.info(f"RouterOS SFP temperature: {temp}°C")
+                temp = _parse_suffixed(temp_str, 'C')
+                self._child(routeros_metrics.sfp_temperature, name).set(temp)
+                logging.debug("RouterOS SFP temperature: %s°C", temp)
             except (ValueError, TypeError) as e:
-                logging.error(f"Failed to parse temperature '{temp_str}': {e}")
+                logging.error("Failed to parse temperature '%s': %s", temp_str, e)
         
         # Process TX bias current
         if 'sfp-tx-bias-current' in sfp_data:
             bias_str = sfp_data['sfp-tx-bias-current']
             try:
-                if isinstance(bias_str, str) and 'mA' in bias_str:
-                    bias = float(bias_str.rstrip('mA'))
-                else:
-                    bias = float(bias_str)
-                routeros_metrics.sfp_tx_bias_current.labels(interface_name=name).set(bias)
-                logging.info(f"RouterOS SFP TX bias current: {bias} mA")
+                bias = _parse_suffixed(bias_str, 'mA')
+                self._child(routeros_metrics.sfp_tx_bias_current, name).set(bias)
+                logging.debug("RouterOS SFP TX bias current: %s mA", bias)
             except (ValueError, TypeError) as e:
-                logging.error(f"Failed to parse TX bias current '{bias_str}': {e}")
+                logging.error("Failed to parse TX bias current '%s': %s", bias_str, e)
         
         # Process voltage
         if 'sfp-supply-voltage' in sfp_data:
             voltage_str = sfp_data['sfp-supply-voltage']
             try:
-                if isinstance(voltage_str, str) and 'V' in voltage_str:
-                    voltage = float(voltage_str.rstrip('V'))
-                else:
-                    voltage = float(voltage_str)
-                routeros_metrics.sfp_voltage.labels(interface_name=name).set(voltage)
-                logging.info(f"RouterOS SFP supply voltage: {voltage}V")
+                voltage = _parse_suffixed(voltage_str, 'V')
+                self._child(routeros_metrics.sfp_voltage, name).set(voltage)
+                logging.debug("RouterOS SFP supply voltage: %sV", voltage)
             except (ValueError, TypeError) as e:
-                logging.error(f"Failed to parse supply voltage '{voltage_str}': {e}")
+                logging.error("Failed to parse supply voltage '%s': %s", voltage_str, e)
         
         # Process optical power readings
         self._process_optical_power(sfp_data, name, link_is_up, current_time)
@@ -338,116 +486,102 @@ class RouterOSCollector:
     
     def _process_optical_power(self, sfp_data: Dict, name: str, link_is_up: bool, current_time: float):
         """Process optical power readings with stale data detection"""
-        
-        # RX Power
-        if 'sfp-rx-power' in sfp_data:
-            rx_power_str = sfp_data['sfp-rx-power']
-            try:
-                if isinstance(rx_power_str, str) and 'dBm' in rx_power_str:
-                    rx_power = float(rx_power_str.rstrip('dBm'))
-                else:
-                    rx_power = float(rx_power_str)
-                
-                # Check for stale data
-                if not link_is_up and rx_power > config.stale_data_threshold_dbm:
-                    logging.warning(f"Link is DOWN but RX power reading is {rx_power} dBm. This may be cached data!")
-                    routeros_metrics.sfp_data_stale.labels(interface_name=name, metric_type='rx_power').set(1.0)
-                else:
-                    routeros_metrics.sfp_data_stale.labels(interface_name=name, metric_type='rx_power').set(0.0)
-                
-                routeros_metrics.sfp_rx_power.labels(interface_name=name).set(rx_power)
-                logging.info(f"RouterOS SFP RX power: {rx_power} dBm")
-                
-            except (ValueError, TypeError) as e:
-                logging.error(f"Failed to parse RX power value '{rx_power_str}' for {name}: {e}")
-        
-        # TX Power
-        if 'sfp-tx-power' in sfp_data:
-            tx_power_str = sfp_data['sfp-tx-power']
+        for field, metric, metric_type, label in _OPTICAL_POWER_FIELDS:
+            if field not in sfp_data:
+                continue
+            
+            power_str = sfp_data[field]
             try:
-                if isinstance(tx_power_str, str) and 'dBm' in tx_power_str:
-                    tx_power = float(tx_power_str.rstrip('dBm'))
-                else:
-                    tx_power = float(tx_power_str)
+                power = _parse_suffixed(power_str, 'dBm')
                 
                 # Check for stale data
-                if not link_is_up and tx_power > config.stale_data_threshold_dbm:
-                    logging.warning(f"Link is DOWN but TX power reading is {tx_power} dBm. This may be cached data!")
-                    routeros_metrics.sfp_data_stale.labels(interface_name=name, metric_type='tx_power').set(1.0)
+                if not link_is_up and power > config.stale_data_threshold_dbm:
+                    logging.warning("Link is DOWN but %s power reading is %s dBm. This may be cached data!", label, power)
+                    routeros_metrics.sfp_data_stale.labels(interface_name=name, metric_type=metric_type).set(1.0)
                 else:
-                    routeros_metrics.sfp_data_stale.labels(interface_name=name, metric_type='tx_power').set(0.0)
+                    routeros_metrics.sfp_data_stale.labels(interface_name=name, metric_type=metric_type).set(0.0)
                 
-                routeros_metrics.sfp_tx_power.labels(interface_name=name).set(tx_power)
-                logging.info(f"RouterOS SFP TX power: {tx_power} dBm")
+                self._child(metric, name).set(power)
+                logging.debug("RouterOS SFP %s power: %s dBm", label, power)
                 
             except (ValueError, TypeError) as e:
-                logging.error(f"Failed to parse TX power value '{tx_power_str}' for {name}: {e}")
+                logging.error("Failed to parse %s power value '%s' for %s: %s", label, power_str, name, e)
     
     def _process_sfp_vendor_serial(self, sfp_data: Dict, name: str):
         """Process SFP vendor serial number information"""
         if 'sfp-vendor-serial' in sfp_data:
             vendor_serial = sfp_data['sfp-vendor-serial']
             if vendor_serial and vendor_serial.strip():
+                # The serial only changes on a module swap; the Info metric keeps
+                # its last value, so there is nothing to update otherwise
+                if vendor_serial == self.last_sfp_vendor_serial:
+                    return
+                
                 # Update the metric
                 routeros_metrics.sfp_vendor_serial.labels(interface_name=name).info({'serial': vendor_serial})
                 
                 # Check for changes
                 if self.last_sfp_vendor_serial is None:
-                    logging.info(f"Initial SFP vendor serial detected: {vendor_serial}")
-                elif vendor_serial != self.last_sfp_vendor_serial:
-                    logging.warning(f"SFP vendor serial changed from {self.last_sfp_vendor_serial} to {vendor_serial}")
+                    logging.info("Initial SFP vendor serial detected: %s", vendor_serial)
+                else:
+                    logging.warning("SFP vendor serial changed from %s to %s", self.last_sfp_vendor_serial, vendor_serial)
                 
                 # Update tracking variable
                 self.last_sfp_vendor_serial = vendor_serial
-                logging.info(f"RouterOS SFP vendor serial: {vendor_serial}")
+                logging.debug("RouterOS SFP vendor serial: %s", vendor_serial)
             else:
-                logging.warning(f"Empty or invalid SFP vendor serial for {name}")
+                logging.warning("Empty or invalid SFP vendor serial for %s", name)
         else:
-            logging.debug(f"No SFP vendor serial information available for {name}")
+            logging.debug("No SFP vendor serial information available for %s", name)
     
-    def _collect_sfp_error_stats(self, iface_id: str, name: str):
-        """Collect detailed SFP error statistics"""
+    def _collect_sfp_error_stats(self, error_stats: Dict, name: str):
+        """Collect detailed SFP error statistics from SFP monitor data"""
         try:
-            # Get SFP error statistics
-            error_stats = self._make_request('interface/ethernet/monitor', 
-                                           method='POST',
-                                           data={'numbers': iface_id, 'duration': '1s'})
-            
             if not error_stats or not isinstance(error_stats, dict):
                 return
             
-            # Map error statistics to metrics
-            error_mapping = [
-                ('sfp-tx-fcs-error', routeros_metrics.sfp_tx_fcs_error),
-                ('sfp-tx-collision', routeros_metrics.sfp_tx_collision),
-                ('sfp-tx-excessive-collision', routeros_metrics.sfp_tx_excessive_collision),
-                ('sfp-tx-late-collision', routeros_metrics.sfp_tx_late_collision),
-                ('sfp-tx-deferred', routeros_metrics.sfp_tx_deferred),
-                ('sfp-rx-too-short', routeros_metrics.sfp_rx_too_short),
-                ('sfp-rx-too-long', routeros_metrics.sfp_rx_too_long),
-                ('sfp-rx-jabber', routeros_metrics.sfp_rx_jabber),
-                ('sfp-rx-fcs-error', routeros_metrics.sfp_rx_fcs_error),
-                ('sfp-rx-align-error', routeros_metrics.sfp_rx_align_error),
-                ('sfp-rx-fragment', routeros_metrics.sfp_rx_fragment),
-                ('sfp-rx-overflow', routeros_metrics.sfp_rx_overflow),
-                ('sfp-tx-underrun', routeros_metrics.sfp_tx_underrun)
-            ]
-            
-            for stat, metric in error_mapping:
+            for stat, metric in _SFP_ERROR_MAPPING:
                 if stat in error_stats:
                     try:
                         value = float(error_stats[stat])
-                        metric.labels(interface_name=name)._value.set(value)
-                        logging.debug(f"Updated {name} {stat}: {value}")
+                        self._child(metric, name)._value.set(value)
+                        logging.debug("Updated %s %s: %s", name, stat, value)
                     except (ValueError, TypeError) as e:
-                        logging.error(f"Error updating {name} {stat}: {e}")
+                        logging.error("Error updating %s %s: %s", name, stat, e)
                         
         except Exception as e:
-            logging.error(f"Error collecting SFP error statistics for {name}: {e}")
+            logging.error("Error collecting SFP error statistics for %s: %s", name, e)
     
     def collect_all_metrics(self) -> bool:
         """Collect all RouterOS metrics"""
-        interface_success = self.collect_interface_metrics()
-        sfp_success = self.collect_sfp_metrics()
+        start_time = time.monotonic()
+        success = False
+        
+        try:
+            # The REST calls of a cycle are independent, so overlap them instead of
+            # paying one round-trip after the other. The SFP monitor is addressed by
+            # name since its .id is only known once the interface list is in; it is
+            # skipped when the last interface list we saw has no such interface (on
+            # the first cycle there is none yet, so it is always sent).
+            name = 'sfp-sfpplus1'
+            known_interfaces = self._interface_cache
+            sfp_expected = known_interfaces is None or any(i.get('name') == name for i in known_interfaces[1])
+            interfaces_future = self.executor.submit(self._get_interfaces)
+            pppoe_future = self.executor.submit(self._make_request, 'interface/pppoe-client')
+            sfp_future = self.executor.submit(self._fetch_sfp_monitor, name, name) if sfp_expected else None
+            
+            # A failed fetch is logged and passed on as empty data, so the other
+            # results are still processed and the cycle is still recorded
+            interfaces = self._future_result(interfaces_future, 'interface list') or []
+            pppoe_interfaces = self._future_result(pppoe_future, 'PPPoE clients') or []
+            sfp_data = (self._future_result(sfp_future, 'SFP monitor data') if sfp_future else None) or {}
+            
+            interface_success = self.collect_interface_metrics(interfaces, pppoe_interfaces, record_metrics=False)
+            sfp_success = self.collect_sfp_metrics(interfaces, sfp_data, record_metrics=False)
+            success = interface_success and sfp_success
+        
+        finally:
+            # Record the cycle as a whole so the duration covers every call
+            self._record_collection(time.monotonic() - start_time, success)
         
-        return interface_success and sfp_success 
\ No newline at end of file
+        return success 
\ No newline at end of file
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Unit tests for the Zaram ONT collector's parsing, telnet and session handling
+
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import os
+import socket
+import subprocess
+import unittest
+from unittest import mock
+
+# config.py builds its global Config at import, so the required settings must exist first
+for _name, _value in {
+    'ROUTEROS_HOST': '192.0.2.1',
+    'ROUTEROS_USER': 'monitor',
+    'ROUTEROS_API_PROTOCOL': 'https',
+    'ROUTEROS_PASS_PATH': 'routeros/monitor',
+    'ZARAM_ONT_IP': '192.168.200.1',
+    'ZARAM_ONT_USER': 'admin',
+    'ZARAM_PASS_PATH': 'zaram/admin',
+    'MONITORED_INTERFACES': 'sfp-sfpplus1',
+    'COLLECTION_INTERVAL_SECONDS': '30',
+    'METRICS_PORT': '9700',
+    'METRICS_HOST': '127.0.0.1',
+    'LOG_FILE': os.devnull,
+    'LOG_MAX_BYTES': '100000',
+    'LOG_BACKUP_COUNT': '1',
+    'SSH_USER': 'admin',
+    'SSH_HOST': '192.0.2.1',
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from prometheus_client import REGISTRY
+
+import zaram_ont_collector
+from config import Config
+from zaram_ont_collector import ZaramONTCollector, _TelnetSocketSpawn
+
+
+def _make_collector() -> ZaramONTCollector:
+    """A collector with a canned ONT password instead of one read from pass"""
+    with mock.patch.object(Config, 'get_zaram_ont_password', return_value='secret'):
+        return ZaramONTCollector()
+
+
+class TelnetSocketSpawnTest(unittest.TestCase):
+    """Option negotiation on the direct tunnel socket"""
+
+    def setUp(self):
+        self.ont, client = socket.socketpair()
+        self.ont.settimeout(2)
+        self.child = _TelnetSocketSpawn(client.detach())
+
+    def tearDown(self):
+        self.child.close()
+        self.ont.close()
+
+    def _read(self) -> bytes:
+        return self.child.read_nonblocking(size=1024, timeout=2)
+
+    def test_negotiation_is_answered_and_stripped(self):
+        # WILL ECHO, WILL SGA, WILL STATUS, DO TTYPE, a subnegotiation and an escaped 0xff
+        self.ont.sendall(b'\xff\xfb\x01\xff\xfb\x03\xff\xfb\x05\xff\xfd\x18'
+                         b'log\xff\xfa\x18\x01\xff\xf0in\xff\xff: ')
+        self.assertEqual(self._read(), b'login\xff: ')
+        self.assertEqual(self.ont.recv(1024), b'\xff\xfd\x01\xff\xfd\x03\xff\xfe\x05\xff\xfc\x18')
+
+    def test_sequence_split_across_reads(self):
+        self.ont.sendall(b'login\xff')
+        self.assertEqual(self._read(), b'login')
+        self.ont.sendall(b'\xfd\x1f: ')
+        self.assertEqual(self._read(), b': ')
+        self.assertEqual(self.ont.recv(1024), b'\xff\xfc\x1f')
+
+    def test_sendline_uses_crlf(self):
+        self.child.sendline('admin')
+        self.assertEqual(self.ont.recv(1024), b'admin\r\n')
+
+
+class CleanBatchOutputTest(unittest.TestCase):
+
+    def test_prompts_and_echoed_lines_are_dropped(self):
+        segment = (b'admin@ZXOS11NPI [/] # sfp info\r\n'
+                   b'vendor name: ZARAM\r\n'
+                   b'\r\n'
+                   b'temperature: 53.250C\r\n'
+                   b'[/] #\r\n'
+                   b'admin@ZXOS11NPI [/] # echo ===MARK_0===\r\n')
+        echoed = frozenset((b'sfp info', b'echo ===MARK_0==='))
+        self.assertEqual(ZaramONTCollector._clean_batch_output(segment, echoed),
+                         'vendor name: ZARAM\ntemperature: 53.250C')
+
+
+class ParsePonStatusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.collector = _make_collector()
+
+    def _link_status(self):
+        return REGISTRY.get_sample_value('zaram_ont_pon_link_status',
+                                         {'interface_name': self.collector.interface_name})
+
+    def _parse(self, output):
+        warnings = []
+        return self.collector._parse_pon_status(output, warnings), self._link_status(), warnings
+
+    def test_known_values(self):
+        self.assertEqual(self._parse('ponlink-status : connect-OK'), (True, 1, []))
+        parsed, status, warnings = self._parse('ponlink-status : connect-fail')
+        self.assertEqual((parsed, status), (True, 0))
+        self.assertEqual(warnings, ['PON link status: DOWN (connect-fail)'])
+        self.assertEqual(self._parse('link status : up'), (True, 1, []))
+
+    def test_unknown_value_reports_down(self):
+        self._parse('ponlink-status : connect-OK')
+        parsed, status, warnings = self._parse('ponlink-status : O7')
+        self.assertEqual((parsed, status), (True, 0))
+        self.assertEqual(warnings, ['PON link status: DOWN (o7, unrecognised value)'])
+
+    def test_legacy_key_does_not_shadow_ponlink_status(self):
+        output = 'ONU status : O5\nponlink-status : connect-OK'
+        self.assertEqual(self._parse(output), (True, 1, []))
+
+    def test_missing_status_leaves_gauge_alone(self):
+        self._parse('ponlink-status : connect-OK')
+        self.assertEqual(self._parse('no link information here'), (False, 1, []))
+
+
+class ProcessOltInfoTest(unittest.TestCase):
+
+    def setUp(self):
+        self.collector = _make_collector()
+
+    def _process(self, output):
+        self.collector._process_olt_info({'onu dump ptp': output})
+        return self.collector.last_vendor_name, self.collector.last_vendor_id
+
+    def test_raw_vendor_id(self):
+        self.assertEqual(self._process('oltVendorId : 414C434C\nversion : 0a1b'),
+                         ('Alcatel-Lucent', 0x414c434c))
+        self.assertEqual(self.collector.last_olt_version, '0a1b')
+
+    def test_prefixed_short_vendor_id(self):
+        self.assertEqual(self._process('vendor id : 0x5a54\nversion : 0001'), ('ZTE', 0x5a54))
+
+    def test_unknown_vendor_id(self):
+        self.assertEqual(self._process('oltVendorId : 01020304\nversion : 0001'), ('Unknown', 0x01020304))
+
+
+class EnsureSessionBackoffTest(unittest.TestCase):
+
+    def setUp(self):
+        self.collector = _make_collector()
+        self.collector._config = mock.Mock(get_zaram_ont_password=mock.Mock(return_value='rotated'))
+        self.now = 1000.0
+        patcher = mock.patch.object(zaram_ont_collector.time, 'monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _login(self, accepted):
+        """Stand-in for _login: a child when the password is accepted, else a rejection"""
+        def login():
+            self.collector._auth_rejected = not accepted
+            return mock.Mock() if accepted else None
+        return mock.patch.object(self.collector, '_login', side_effect=login)
+
+    def test_rejected_login_backs_off_and_doubles(self):
+        with self._login(accepted=False) as login:
+            self.assertIsNone(self.collector._ensure_session())
+            self.assertEqual(login.call_count, 2)  # one retry with the re-read password
+            self.assertEqual(self.collector._auth_backoff, 60)
+
+            self.now += 59
+            self.assertIsNone(self.collector._ensure_session())
+            self.assertEqual(login.call_count, 2)
+
+            self.now += 1
+            self.assertIsNone(self.collector._ensure_session())
+            self.assertEqual(login.call_count, 3)  # a single attempt once backing off
+            self.assertEqual(self.collector._auth_backoff, 120)
+
+    def test_successful_login_resets_backoff(self):
+        with self._login(accepted=False):
+            self.collector._ensure_session()
+        self.now += 60
+        with self._login(accepted=True), \
+                mock.patch.object(self.collector, '_probe_echo', return_value=True):
+            self.assertIsNotNone(self.collector._ensure_session())
+        self.assertEqual(self.collector.zaram_ont_password, 'rotated')
+        self.assertEqual((self.collector._auth_backoff, self.collector._auth_retry_at), (0, 0.0))
+        self.assertTrue(self.collector._batch_supported)
+
+
+class OpenDirectTelnetTest(unittest.TestCase):
+
+    def test_failed_tunnel_setup_falls_back_to_router_telnet(self):
+        collector = _make_collector()
+        collector.tunnel_port = 2323
+        no_master = subprocess.CompletedProcess([], 255)
+        with mock.patch.object(zaram_ont_collector.socket, 'create_connection', side_effect=ConnectionRefusedError), \
+                mock.patch.object(zaram_ont_collector.subprocess, 'run',
+                                  side_effect=[no_master, subprocess.TimeoutExpired('ssh', 15)]), \
+                mock.patch.object(collector, '_open_router_telnet', return_value='router child') as router:
+            self.assertEqual(collector._open_direct_telnet(), 'router child')
+        router.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
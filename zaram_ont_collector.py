@@ -1,49 +1,212 @@
 #!/usr/bin/env python3
 
+import atexit
+import contextlib
 import logging
+import os
+import threading
 import time
 import re
+import socket
+import subprocess
 import pexpect
-from typing import Dict, Optional, Any, Tuple, TypeVar, Callable
-from datetime import datetime
-from functools import wraps
+from pexpect import fdpexpect
+from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
 
 from config import Config
 from metrics_registry import zaram_ont_metrics, collection_metrics
 
-# Type variable for generic return type
-T = TypeVar('T')
+# ONT commands per collection
+_REGULAR_COMMANDS = (
+    'sfp info',              # Basic SFP module details
+    'onu show pon counter',  # FEC counters (at the end of output)
+    'onu show ponlink',      # PON link status
+    'onu show pon serdes',   # SerDes state
+    'sysmon cpu',            # CPU usage
+    'sysmon memory',         # Memory usage
+)
+_OLT_VENDOR_COMMANDS = (
+    'onu dump ptp',          # PTP timing info including vendor ID
+)
+_ALL_COMMANDS = _REGULAR_COMMANDS + _OLT_VENDOR_COMMANDS
+
+# OpenSSH multiplexing keeps the TCP/SSH handshake alive between logins. The
+# session is small interactive exchanges, so mark it low-delay and keep it alive.
+_SSH_MUX_OPTS = [
+    '-o', 'ControlMaster=auto', '-o', 'ControlPath=~/.ssh/cm-%r@%h:%p', '-o', 'ControlPersist=10m',
+    '-o', 'IPQoS=lowdelay', '-o', 'TCPKeepAlive=yes', '-o', 'ServerAliveInterval=30',
+]
+
+# Marker echoed after each batched ONT command. The lookbehind keeps the echoed
+# "echo ===MARK_n===" input line from being mistaken for the marker itself.
+_MARKER_RE = re.compile(rb'(?<!echo )===MARK_(\d+)===')
+# Sent once after login; only a shell with echo prints it without the "echo " prefix
+_ECHO_PROBE = '===ECHO_PROBE==='
+_ECHO_PROBE_RE = re.compile(rb'(?<!echo )' + _ECHO_PROBE.encode())
+# ONT prompt ("admin@ZXOS11NPI [/] #") as matched by expect_list() on the (bytes)
+# session: index 0 is the prompt, index 1 a timeout. [^#]* stops at the prompt's
+# own '#' rather than backtracking from the end of a long buffer like '.*' would.
+_ONT_PROMPT_RE = re.compile(rb'(?:admin@)?ZXOS11NPI[^#]*#')
+_ONT_PROMPT_PATTERNS = [_ONT_PROMPT_RE, pexpect.TIMEOUT]
+# Login-phase expect lists, compiled once like _ONT_PROMPT_PATTERNS
+_ROUTER_PROMPT_RE = re.compile(rb'\[.*\] >', re.DOTALL)
+_ROUTER_LOGIN_PATTERNS = [_ROUTER_PROMPT_RE, re.compile(rb'password:', re.DOTALL), pexpect.EOF, pexpect.TIMEOUT]
+_ONT_LOGIN_PATTERNS = [re.compile(rb'login:', re.DOTALL), re.compile(rb'Connection refused', re.DOTALL), pexpect.TIMEOUT]
+_ONT_PASSWORD_PATTERNS = [re.compile(rb'Password:', re.DOTALL), pexpect.TIMEOUT]
+# The first shell prompt confirms the login; matching all of it (not just the
+# hostname) leaves no prompt fragment in front of the first command's output
+_ONT_AUTH_PATTERNS = [
+    _ONT_PROMPT_RE,
+    re.compile(rb'incorrect|denied|^login:', re.IGNORECASE | re.MULTILINE | re.DOTALL),
+    pexpect.TIMEOUT,
+]
+# Wait after the ONT rejects the (re-read) password, doubling per rejection up to the max
+_AUTH_BACKOFF_MIN_SECONDS = 60
+_AUTH_BACKOFF_MAX_SECONDS = 3600
+
+# Telnet protocol bytes (RFC 854) needed to answer option negotiation on the
+# direct socket path; the RouterOS telnet client does this for the router path
+_IAC, _DONT, _DO, _WONT, _WILL, _SB, _SE = 255, 254, 253, 252, 251, 250, 240
+# Options a plain telnet client lets the server enable: server echo and suppress-go-ahead
+_TELNET_ACCEPTED_OPTIONS = frozenset((1, 3))
+
+# Start of an ONT prompt line, which may carry the echoed command after the '#'
+_PROMPT_PREFIXES = (b'admin@ZXOS11NPI', b'ZXOS11NPI')
+
+# Per-command output cleanup, run on the raw bytes before decoding: strip each
+# line, then drop blank lines and anything carrying the ONT prompt
+_RE_LINE_EDGES = re.compile(rb'(?m)^[ \t]+|[ \t\r]+$')
+_RE_PROMPT_LINES = re.compile(rb'(?m)^(?:.*(?:admin@|ZXOS11NPI).*)?(?:\n|\Z)')
+
+
+@lru_cache(maxsize=64)
+def _hex_to_int(value: str) -> int:
+    """Convert a hex code from ONT output; the codes come from a small fixed set, so memoize"""
+    return int(value, 16)
 
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0) -> Callable:
-    """Decorator to retry a function on failure with exponential backoff.
-    
-    Args:
-        max_retries: Maximum number of retry attempts
-        delay: Initial delay between retries (will be exponentially increased)
-    """
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-            for attempt in range(max_retries):
-                try:
-                    result = func(*args, **kwargs)
-                    # For command outputs, retry if empty
-                    if isinstance(result, dict) and not any(result.values()):
-                        raise ValueError("All command outputs are empty")
-                    if isinstance(result, str) and not result.strip():
-                        raise ValueError("Command output is empty")
-                    return result
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        wait_time = delay * (2 ** attempt)  # Exponential backoff
-                        logging.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {wait_time:.1f}s...")
-                        time.sleep(wait_time)
-            logging.error(f"All {max_retries} attempts failed. Last error: {str(last_exception)}")
-            raise last_exception
-        return wrapper
-    return decorator
+
+# Parsers for the ONT command outputs, compiled once at import.
+# All "sfp info" fields are matched by one alternation; the group name says which.
+_RE_SFP_ALL = re.compile(
+    r'temperature\s*:\s*(?P<temp>[\d.-]+)\s*C'                                   # "temperature: 53.250C"
+    r'|rx\s*optical\s*power\s*:\s*[\d.]+\s*mW\s*\((?P<rx>[\d.-]+)\s*dBm\)'          # "rx optical power: 0.013mW (-18.697dBm)"
+    r'|tx\s*output\s*power\s*:\s*[\d.]+\s*mW\s*\((?P<tx>[\d.-]+)\s*dBm\)'           # "tx output power: 4.785mW (6.799dBm)"
+    r'|supply\s*voltage\s*:\s*(?P<voltage>[\d.]+)\s*V'                             # "supply voltage: 3.340V"
+    r'|tx\s*bias\s*current\s*:\s*(?P<bias>[\d.]+)\s*mA'                            # "tx bias current: 18.368mA"
+    r'|diagnostic\s*monitoring\s*type\s*:\s*(?P<diag>0x[0-9a-fA-F]+)',              # "diagnostic monitoring type: 0x68"
+    re.IGNORECASE)
+# group -> (metric, description, converter, normal low, normal high, unit)
+_SFP_FIELDS = {
+    'temp': (zaram_ont_metrics.ont_sfp_temperature, 'temperature', float, None, 70, '°C'),
+    'rx': (zaram_ont_metrics.ont_sfp_rx_power, 'RX power', float, -30, -8, ' dBm'),
+    'tx': (zaram_ont_metrics.ont_sfp_tx_power, 'TX power', float, 0, 10, ' dBm'),
+    'voltage': (zaram_ont_metrics.ont_sfp_voltage, 'voltage', float, 3.0, 3.6, 'V'),
+    'bias': (zaram_ont_metrics.ont_sfp_tx_bias_current, 'TX bias current', float, 5, 30, ' mA'),
+    'diag': (zaram_ont_metrics.ont_sfp_diagnostic_type, 'diagnostic type', _hex_to_int, None, None, ''),
+}
+_RE_FEC_CORRECTED_BYTES = re.compile(r'Corrected byte\(8-byte\)\s*:\s*(\d+)', re.IGNORECASE)
+_RE_FEC_CORRECTED_CODEWORDS = re.compile(r'Corrected code words\(8-byte\)\s*:\s*(\d+)', re.IGNORECASE)
+_RE_FEC_UNCORRECTABLE = re.compile(r'Uncorrectable code words\(8-byte\)\s*:\s*(\d+)', re.IGNORECASE)
+_RE_FEC_TOTAL = re.compile(r'Total code words\(8-byte\)\s*:\s*(\d+)', re.IGNORECASE)
+_RE_FEC = re.compile(
+    r'Corrected byte\(8-byte\)\s*:\s*(?P<cb>\d+).*?'
+    r'Corrected code words\(8-byte\)\s*:\s*(?P<cc>\d+).*?'
+    r'Uncorrectable code words\(8-byte\)\s*:\s*(?P<uc>\d+).*?'
+    r'Total code words\(8-byte\)\s*:\s*(?P<tc>\d+)',
+    re.IGNORECASE | re.DOTALL)
+# group -> (single-field fallback, metric, description, warn above)
+_FEC_FIELDS = (
+    ('cb', _RE_FEC_CORRECTED_BYTES, zaram_ont_metrics.ont_pon_fec_corrected_bytes, 'corrected bytes', 1000),
+    ('cc', _RE_FEC_CORRECTED_CODEWORDS, zaram_ont_metrics.ont_pon_fec_corrected_codewords, 'corrected codewords', 100),
+    ('uc', _RE_FEC_UNCORRECTABLE, zaram_ont_metrics.ont_pon_fec_uncorrectable_codewords, 'uncorrectable codewords', 0),
+    ('tc', _RE_FEC_TOTAL, zaram_ont_metrics.ont_pon_fec_total_codewords, 'total codewords', None),
+)
+# Current firmware's "ponlink-status : <value>" line, with any value; mapped in _parse_pon_status
+_RE_PON_LINK = re.compile(r'ponlink-status\s*:\s*(?P<val>[^\s]+)', re.IGNORECASE)
+# Older firmware key variants, only trusted with an explicit up/down value; tried
+# after _RE_PON_LINK so e.g. "ONU status : O5" cannot shadow the ponlink-status line
+_RE_PON_LINK_LEGACY = re.compile(
+    r'(?:link\s*status|pon\s*status|status|link|connection)\s*:\s*(?P<val>up|down)\b',
+    re.IGNORECASE)
+# Link status value (lowercased) -> ont_pon_link_status; anything not listed is
+# reported as down, since a stale "up" is the worst failure mode for this metric
+_PON_LINK_STATES = {'connect-ok': 1, 'up': 1, 'connect-fail': 0, 'disconnect': 0, 'down': 0}
+_RE_SERDES = re.compile(r'Serdes\s*state\s*\|\s*([\w\s]+)\((0x[0-9a-fA-F]+)\)', re.IGNORECASE)
+# One ont_pon_serdes_text_state series per state; the current one is set to 1
+_SERDES_TEXT_STATES = ("Very good", "Good", "Poor", "Error", "Failed", "Unknown")
+_RE_CPU = re.compile(r'cpu\s*usage\s*:\s*([\d.]+)\s*%', re.IGNORECASE)
+_RE_MEMORY = re.compile(r'used/total\s*=\s*(\d+)/(\d+)\s*\(([\d.]+)\s*%\)')
+# Usage (%) above which the system metrics log a warning
+_CPU_WARN_PERCENT = 80.0
+_MEMORY_WARN_PERCENT = 85.0
+# OLT vendor ID ("oltVendorId : 414c434c", or "vendor id : 0x414c434c" on some
+# firmware) and OLT version from "onu dump ptp", found in one pass
+_RE_OLT_INFO = re.compile(
+    r'oltVendorId\s*:\s*(?P<raw>[0-9a-fA-F]+)'
+    r'|(?:olt\s*)?vendor(?:\s*id)?\s*:\s*0x(?P<prefixed>[0-9a-fA-F]+)'
+    r'|version\s*:\s*(?P<version>[0-9a-fA-F]+)',
+    re.IGNORECASE)
+
+class _TelnetSocketSpawn(fdpexpect.fdspawn):
+    """fdspawn over a raw telnet connection: answers option negotiation and strips it from the output"""
+    
+    def __init__(self, fd: int, **kwargs):
+        super().__init__(fd, **kwargs)
+        self.linesep = b'\r\n'  # telnet (NVT) ends lines with CR LF
+        self._telnet_pending = b''  # incomplete IAC sequence left over from the last read
+    
+    def read_nonblocking(self, size=1, timeout=-1):
+        return self._strip_telnet_commands(super().read_nonblocking(size, timeout))
+    
+    def _strip_telnet_commands(self, data: bytes) -> bytes:
+        """Remove IAC sequences from data, refusing every option except echo and suppress-go-ahead"""
+        data = self._telnet_pending + data
+        self._telnet_pending = b''
+        if b'\xff' not in data:
+            return data
+        
+        output = bytearray()
+        replies = bytearray()
+        pos = 0
+        while True:
+            iac = data.find(b'\xff', pos)
+            if iac < 0:
+                output += data[pos:]
+                break
+            output += data[pos:iac]
+            command = data[iac + 1] if iac + 1 < len(data) else None
+            if command in (_DO, _DONT, _WILL, _WONT):
+                if iac + 2 >= len(data):
+                    command = None
+                else:
+                    option = data[iac + 2]
+                    if command == _DO:
+                        replies += bytes((_IAC, _WONT, option))
+                    elif command == _WILL:
+                        replies += bytes((_IAC, _DO if option in _TELNET_ACCEPTED_OPTIONS else _DONT, option))
+                    pos = iac + 3
+                    continue
+            elif command == _SB:
+                end = data.find(bytes((_IAC, _SE)), iac + 2)
+                if end >= 0:
+                    pos = end + 2
+                    continue
+                command = None
+            elif command == _IAC:  # escaped 0xff data byte
+                output.append(_IAC)
+                pos = iac + 2
+                continue
+            elif command is not None:  # two-byte command (NOP, GA, ...)
+                pos = iac + 2
+                continue
+            # Sequence split across reads: keep it for the next one
+            self._telnet_pending = data[iac:]
+            break
+        
+        if replies:
+            os.write(self.child_fd, replies)
+        return bytes(output)
 
 class ZaramONTCollector:
     """Collector for Zaram ONT metrics"""
@@ -58,7 +221,12 @@ class ZaramONTCollector:
         self.ssh_user = config_obj.ssh_user
         self.zaram_ont_ip = config_obj.zaram_ont_ip
         self.zaram_ont_user = config_obj.zaram_ont_user
+        # Read from pass once and kept for the collector's lifetime; re-read only
+        # when the ONT rejects it
+        self._config = config_obj
         self.zaram_ont_password = config_obj.get_zaram_ont_password()
+        self.tunnel_port = config_obj.zaram_ont_tunnel_port
+        self.read_buffer_bytes = config_obj.ont_read_buffer_bytes
         if not self.zaram_ont_password:
             raise ValueError("Failed to get Zaram ONT password")
             
@@ -66,147 +234,230 @@ class ZaramONTCollector:
         
         # Load OLT vendor map from config
         self.olt_vendor_map = config_obj.olt_vendor_map
+        # Numeric vendor ID -> vendor name, so the ONT's hex spelling doesn't matter
+        self._vendor_table = {int(hex_id, 16): name for hex_id, name in self.olt_vendor_map.items()}
         self.last_vendor_id = None
         self.last_vendor_name = None
         self.last_olt_version = None
+        self.olt_vendor_cache_seconds = config_obj.olt_vendor_cache_seconds
+        self._olt_info_collected_at = None  # monotonic time of the last good OLT reading
+        
+        # Long-lived SSH -> telnet session to the ONT, reused across cycles
+        self._child = None
+        # Whether the ONT shell accepts batched commands; probed after each login
+        self._batch_supported = False
+        self._auth_rejected = False
+        # After a rejected password: current wait (s) and monotonic time of the next login attempt
+        self._auth_backoff = 0
+        self._auth_retry_at = 0.0
+        # Re-entrant so a caller holding session() can nest collections on the same session
+        self._session_lock = threading.RLock()
+        self._session_depth = 0
+        atexit.register(self.close)
+        # (metric, extra labels) -> (labelled child, last value written)
+        self._gauge_cache: Dict[Tuple, Tuple[Any, float]] = {}
+        # Collection metric children, bound once
+        self._collection_duration = collection_metrics.collection_duration_seconds.labels(collector_type='zaram_ont')
+        self._collection_success = collection_metrics.collection_success.labels(collector_type='zaram_ont')
+        self._collection_timestamp = collection_metrics.last_collection_timestamp.labels(collector_type='zaram_ont')
+        self._collection_errors = collection_metrics.collection_errors_total.labels(
+            collector_type='zaram_ont', error_type='collection_error')
+        # command -> hash of the output last parsed successfully for it
+        self._output_hashes: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+        self._last_serdes_text = None
     
     def collect_all_metrics(self) -> bool:
         """Collect all Zaram ONT metrics"""
-        start_time = time.time()
+        start_time = time.monotonic()
         success = False
         
         try:
             logging.info("Collecting Zaram ONT metrics...")
             
-            # Connect to the ONT module and collect data
-            command_outputs = self._connect_and_collect()
+            # Connect to the ONT module and collect data, leaving out the OLT
+            # command while its cached reading is still fresh
+            include_olt = not self._olt_info_fresh()
+            command_outputs = self._collect(_ALL_COMMANDS if include_olt else _REGULAR_COMMANDS)
             
             if command_outputs:
                 # Process the collected data
-                self._process_sfp_metrics(command_outputs)
-                self._process_pon_metrics(command_outputs)
-                self._process_system_metrics(command_outputs)
-                self._process_olt_info(command_outputs)
-                
-                success = True
-                logging.info("Zaram ONT metrics collection completed successfully")
+                processors = [self._process_sfp_metrics, self._process_pon_metrics, self._process_system_metrics]
+                if include_olt:
+                    processors.append(self._process_olt_info)
+                success = self._process_outputs(command_outputs, processors)
+                if success:
+                    logging.info("Zaram ONT metrics collection completed successfully")
             else:
                 logging.error("Failed to collect data from Zaram ONT module")
         
         except Exception as e:
             logging.error(f"Error collecting Zaram ONT metrics: {e}")
-            collection_metrics.collection_errors_total.labels(collector_type='zaram_ont', error_type='collection_error').inc()
+            self._collection_errors.inc()
         
         finally:
             # Update collection metrics
-            duration = time.time() - start_time
-            collection_metrics.collection_duration_seconds.labels(collector_type='zaram_ont').set(duration)
-            collection_metrics.collection_success.labels(collector_type='zaram_ont').set(1 if success else 0)
-            if success:
-                collection_metrics.last_collection_timestamp.labels(collector_type='zaram_ont').set(time.time())
+            self._record_collection(time.monotonic() - start_time, success)
         
         return success
 
     def collect_regular_metrics(self) -> bool:
         """Collect regular Zaram ONT metrics (excluding OLT vendor info)"""
-        start_time = time.time()
+        start_time = time.monotonic()
         success = False
         
         try:
             logging.info("Collecting Zaram ONT regular metrics...")
             
             # Connect to the ONT module and collect data
-            command_outputs = self._connect_and_collect_regular()
+            command_outputs = self._collect(_REGULAR_COMMANDS)
             
             if command_outputs:
                 # Process the collected data (excluding OLT info)
-                self._process_sfp_metrics(command_outputs)
-                self._process_pon_metrics(command_outputs)
-                self._process_system_metrics(command_outputs)
-                
-                success = True
-                logging.info("Zaram ONT regular metrics collection completed successfully")
+                success = self._process_outputs(command_outputs, (
+                    self._process_sfp_metrics, self._process_pon_metrics, self._process_system_metrics))
+                if success:
+                    logging.info("Zaram ONT regular metrics collection completed successfully")
             else:
                 logging.error("Failed to collect regular data from Zaram ONT module")
         
         except Exception as e:
             logging.error(f"Error collecting Zaram ONT regular metrics: {e}")
-            collection_metrics.collection_errors_total.labels(collector_type='zaram_ont', error_type='collection_error').inc()
+            self._collection_errors.inc()
         
         finally:
             # Update collection metrics
-            duration = time.time() - start_time
-            collection_metrics.collection_duration_seconds.labels(collector_type='zaram_ont').set(duration)
-            collection_metrics.collection_success.labels(collector_type='zaram_ont').set(1 if success else 0)
-            if success:
-                collection_metrics.last_collection_timestamp.labels(collector_type='zaram_ont').set(time.time())
+            self._record_collection(time.monotonic() - start_time, success)
         
         return success
 
     def collect_olt_vendor_info(self) -> bool:
         """Collect OLT vendor information"""
+        # The gauges keep their last values, so a recent reading needs no ONT session at all
+        if self._olt_info_fresh():
+            logging.debug("Using cached OLT vendor information (%s, version %s)", self.last_vendor_name, self.last_olt_version)
+            return True
+        
         success = False
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             logging.info("Collecting OLT vendor information...")
             
             # Connect to the ONT module and collect data
-            command_outputs = self._connect_and_collect_olt_vendor()
+            command_outputs = self._collect(_OLT_VENDOR_COMMANDS)
             
             if command_outputs:
                 # Process the collected data
-                self._process_olt_info(command_outputs)
-                
-                success = True
-                logging.info("OLT vendor information collection completed successfully")
+                success = self._process_outputs(command_outputs, (self._process_olt_info,))
+                if success:
+                    logging.info("OLT vendor information collection completed successfully")
             else:
                 logging.error("Failed to collect data from Zaram ONT module")
         
         except Exception as e:
             logging.error(f"Error collecting OLT vendor information: {str(e)}")
-            collection_metrics.collection_errors_total.labels(collector_type='zaram_ont', error_type='collection_error').inc()
+            self._collection_errors.inc()
         
         finally:
             # Update collection metrics
-            duration = time.time() - start_time
-            collection_metrics.collection_duration_seconds.labels(collector_type='zaram_ont').set(duration)
-            collection_metrics.collection_success.labels(collector_type='zaram_ont').set(1 if success else 0)
-            if success:
-                collection_metrics.last_collection_timestamp.labels(collector_type='zaram_ont').set(time.time())
+            self._record_collection(time.monotonic() - start_time, success)
         
         return success
     
-    def _connect_and_collect(self) -> Optional[Dict[str, str]]:
-        """Connect to the ONT module and collect command outputs"""
-        try:
-            logging.info(f"Connecting to {self.ssh_user}@{self.ssh_host}...")
-            child = pexpect.spawn(f'ssh {self.ssh_user}@{self.ssh_host}')
-            
-            # Handle SSH password prompt if needed (should use SSH keys)
-            i = child.expect(['password:', pexpect.EOF, pexpect.TIMEOUT], timeout=5)
-            if i == 0:  # password prompt
-                logging.info("SSH password required, using SSH key authentication")
-                # If we get here, SSH key authentication failed
-                child.close()
-                return None
+    def _olt_info_fresh(self) -> bool:
+        """Whether the last OLT vendor reading is recent enough to skip 'onu dump ptp'"""
+        return (self._olt_info_collected_at is not None
+                and time.monotonic() - self._olt_info_collected_at < self.olt_vendor_cache_seconds)
+    
+    def _process_outputs(self, command_outputs: Dict[str, str], processors) -> bool:
+        """Run each processor on the outputs; a failing one is logged and does not stop the rest"""
+        success = True
+        for processor in processors:
+            try:
+                processor(command_outputs)
+            except Exception as e:
+                logging.error(f"Error in {processor.__name__}: {e}")
+                self._collection_errors.inc()
+                success = False
+        return success
+    
+    def _record_collection(self, duration: float, success: bool):
+        """Update the Zaram ONT collection duration, success and timestamp metrics"""
+        self._collection_duration.set(duration)
+        self._collection_success.set(1 if success else 0)
+        if success:
+            self._collection_timestamp.set(time.time())
+    
+    def _open_router_telnet(self):
+        """SSH to RouterOS and start its telnet client towards the ONT"""
+        logging.info(f"Connecting to {self.ssh_user}@{self.ssh_host}...")
+        child = pexpect.spawn(' '.join(['ssh'] + _SSH_MUX_OPTS + [f'{self.ssh_user}@{self.ssh_host}']),
+                              maxread=self.read_buffer_bytes)
+        
+        # Wait for the router prompt, bailing out on a password prompt (should use SSH keys)
+        i = child.expect_list(_ROUTER_LOGIN_PATTERNS, timeout=10)
+        if i == 1:  # password prompt
+            logging.info("SSH password required, using SSH key authentication")
+            # If we get here, SSH key authentication failed
+            child.close()
+            return None
+        if i != 0:  # EOF, timeout or other error
+            logging.error("Failed to get router prompt")
+            child.close()
+            return None
             
-            # Wait for router prompt
-            i = child.expect([r'\[.*\] >', pexpect.TIMEOUT], timeout=10)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get router prompt")
-                child.close()
+        logging.info("Connected to RouterOS")
+        
+        # Start telnet to SFP
+        logging.info(f"Starting telnet to {self.zaram_ont_ip}...")
+        child.sendline(f'/system telnet {self.zaram_ont_ip}')
+        return child
+    
+    def _open_direct_telnet(self):
+        """Connect straight to the ONT's telnet port through an SSH local forward"""
+        address = ('127.0.0.1', self.tunnel_port)
+        try:
+            sock = socket.create_connection(address, timeout=5)
+        except OSError:
+            # No forward yet: add it to the multiplexed SSH master (starting one if needed)
+            logging.info(f"Forwarding 127.0.0.1:{self.tunnel_port} to {self.zaram_ont_ip}:23 via {self.ssh_host}")
+            target = f'{self.ssh_user}@{self.ssh_host}'
+            forward = f'{self.tunnel_port}:{self.zaram_ont_ip}:23'
+            try:
+                if subprocess.run(['ssh'] + _SSH_MUX_OPTS + ['-O', 'check', target],
+                                  capture_output=True, timeout=15).returncode != 0:
+                    # The backgrounded master keeps any output pipe open until it exits,
+                    # so it must not get one to wait on
+                    subprocess.run(['ssh'] + _SSH_MUX_OPTS + ['-o', 'BatchMode=yes', '-f', '-N', target],
+                                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, timeout=15, check=True)
+                subprocess.run(['ssh'] + _SSH_MUX_OPTS + ['-O', 'forward', '-L', forward, target],
+                               capture_output=True, timeout=15, check=True)
+                sock = socket.create_connection(address, timeout=5)
+            except (subprocess.SubprocessError, OSError) as e:
+                logging.warning(f"Could not set up the ONT tunnel ({e}), using the router's telnet client")
+                return self._open_router_telnet()
+        
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(None)
+        # Hand the fd over to the child, which closes it; a socket object still
+        # holding it would close the (possibly reused) fd number again when collected
+        return _TelnetSocketSpawn(sock.detach(), maxread=self.read_buffer_bytes)
+    
+    def _login(self):
+        """Open a telnet session to the ONT and log in, returning the logged-in child"""
+        child = None
+        self._auth_rejected = False
+        try:
+            child = self._open_direct_telnet() if self.tunnel_port else self._open_router_telnet()
+            if child is None:
                 return None
-                
-            logging.info("Connected to RouterOS")
-            
-            # Start telnet to SFP
-            logging.info(f"Starting telnet to {self.zaram_ont_ip}...")
-            child.sendline(f'/system telnet {self.zaram_ont_ip}')
+            # Every exchange waits for the prompt, so pexpect's 50ms pre-send pause buys nothing
+            child.delaybeforesend = None
             
             # Handle telnet login
-            i = child.expect(['login:', 'Connection refused', pexpect.TIMEOUT], timeout=10)
+            i = child.expect_list(_ONT_LOGIN_PATTERNS, timeout=10)
             if i != 0:  # not login prompt
-                error_msg = child.before.decode('utf-8', 'ignore') if child.before else 'None'
+                error_msg = child.before[-200:] if child.before else 'None'
                 logging.error(f"Failed to get login prompt. Got: {error_msg}")
                 child.close()
                 return None
@@ -214,764 +465,582 @@ class ZaramONTCollector:
             logging.info("Sending username...")
             child.sendline(self.zaram_ont_user)
             
-            i = child.expect(['Password:', pexpect.TIMEOUT], timeout=5)
+            i = child.expect_list(_ONT_PASSWORD_PATTERNS, timeout=5)
             if i != 0:  # timeout or other error
                 logging.error("Failed to get password prompt")
                 child.close()
                 return None
                 
             logging.info("Sending password...")
-            if self.zaram_ont_password:
-                child.sendline(self.zaram_ont_password)
-            else:
+            if not self.zaram_ont_password:
                 logging.error("Zaram ONT password is None")
                 child.close()
                 return None
+            password: str = self.zaram_ont_password  # Type assertion
+            child.sendline(password)
             
-            # Look for command prompt
-            i = child.expect(['ZXOS11NPI', pexpect.TIMEOUT], timeout=5)
+            # Wait for the shell prompt, which doubles as the login check
+            i = child.expect_list(_ONT_AUTH_PATTERNS, timeout=5)
+            if i == 1:
+                logging.error("ONT rejected the login")
+                self._auth_rejected = True
+                child.close()
+                return None
             if i != 0:  # timeout or other error
                 logging.error("Failed to get SFP module prompt")
                 child.close()
                 return None
                 
             logging.info("Successfully logged in to SFP module")
-            
-            # Run commands and collect outputs
-            command_outputs = self._run_commands(child)
-            
-            # Exit telnet and close connection
-            child.sendline('exit')  # exit telnet
-            child.expect(r'\[.*\] >', timeout=5)
-            child.sendline('quit')  # exit SSH
-            child.close()
-            
-            return command_outputs
+            return child
             
         except Exception as e:
-            logging.error(f"Error in _connect_and_collect: {str(e)}", exc_info=True)
+            logging.error(f"Error in _login: {str(e)}", exc_info=True)
             try:
-                if 'child' in locals():
+                if child is not None:
                     child.close()
             except:
                 pass
             return None
     
-    def _run_commands(self, child) -> Dict[str, str]:
+    def _probe_session(self, child) -> bool:
+        """Check that an existing session still answers with the ONT prompt"""
+        try:
+            # Drop anything left over from the previous cycle (e.g. a late prompt
+            # after a timed out command) so it cannot satisfy the probe
+            self._drain(child)
+            
+            child.sendline('')
+            i = child.expect_list(_ONT_PROMPT_PATTERNS, timeout=2)
+            return i == 0
+        except (pexpect.EOF, OSError):
+            return False
+    
+    def _probe_echo(self, child) -> bool:
+        """Check once per login that the shell has echo, which batched commands rely on"""
+        try:
+            child.sendline(f"echo {_ECHO_PROBE}")
+            # The marker comes back before the prompt only if echo ran
+            i = child.expect_list([_ECHO_PROBE_RE, _ONT_PROMPT_RE, pexpect.TIMEOUT], timeout=3)
+            if i == 0:
+                child.expect_list(_ONT_PROMPT_PATTERNS, timeout=3)
+                return True
+        except pexpect.EOF:
+            return False
+        logging.warning("ONT shell has no echo, running commands one at a time")
+        return False
+    
+    def _ensure_session(self):
+        """Return a live ONT session, logging in again only when needed"""
+        if self._child is not None and self._child.isalive() and self._probe_session(self._child):
+            return self._child
+        
+        if self._child is not None:
+            logging.warning("ONT session lost, reconnecting")
+            self._close_session()
+        
+        # Don't keep hammering the ONT with a password it rejects (risks a lockout)
+        now = time.monotonic()
+        if now < self._auth_retry_at:
+            logging.warning(f"ONT login rejected earlier, next attempt in {self._auth_retry_at - now:.0f}s")
+            return None
+        if self._auth_backoff:
+            # Pick up a password fixed in pass while we were backing off
+            self.zaram_ont_password = self._config.get_zaram_ont_password()
+        
+        self._child = self._login()
+        if self._child is None and self._auth_rejected and not self._auth_backoff:
+            # The password may have been rotated in pass since it was read
+            logging.warning("Re-reading the ONT password and retrying the login once")
+            self.zaram_ont_password = self._config.get_zaram_ont_password()
+            self._child = self._login()
+        
+        if self._child is None and self._auth_rejected:
+            self._auth_backoff = min(self._auth_backoff * 2 or _AUTH_BACKOFF_MIN_SECONDS, _AUTH_BACKOFF_MAX_SECONDS)
+            self._auth_retry_at = time.monotonic() + self._auth_backoff
+            logging.error(f"ONT still rejects the login, not retrying for {self._auth_backoff}s")
+        elif self._child is not None:
+            self._auth_backoff = 0
+            self._auth_retry_at = 0.0
+            self._batch_supported = self._probe_echo(self._child)
+        return self._child
+    
+    def _close_session(self):
+        """Leave telnet and SSH and drop the current session"""
+        child, self._child = self._child, None
+        if child is None:
+            return
+        try:
+            if child.isalive():
+                child.sendline('exit')  # exit telnet
+                if not self.tunnel_port:
+                    child.expect_list([_ROUTER_PROMPT_RE], timeout=5)
+                    child.sendline('quit')  # exit SSH
+        except Exception:
+            pass
+        finally:
+            child.close()
+    
+    def close(self):
+        """Close the persistent ONT session"""
+        with self._session_lock:
+            self._close_session()
+    
+    @contextlib.contextmanager
+    def session(self):
+        """Hold the ONT session for the duration of the block, yielding the child (or None)
+        
+        Nested uses share the session entered by the outermost one, so a scheduler
+        tick that needs several collections pays for at most one login.
+        """
+        with self._session_lock:
+            child = self._child if self._session_depth else self._ensure_session()
+            self._session_depth += 1
+            try:
+                yield child
+            except Exception:
+                self._close_session()
+                raise
+            finally:
+                self._session_depth -= 1
+    
+    def _collect(self, commands: Tuple[str, ...]) -> Optional[Dict[str, str]]:
+        """Run the given commands on the persistent ONT session"""
+        try:
+            with self.session() as child:
+                if child is None:
+                    return None
+                return self._run_commands(child, commands)
+        except Exception as e:
+            logging.error(f"Error collecting from ONT session: {str(e)}", exc_info=True)
+            return None
+    
+    def _run_commands(self, child, commands: Tuple[str, ...]) -> Dict[str, str]:
         """Run commands on the ONT module and return outputs"""
-        command_outputs = {}
+        logging.info("Running %d ONT command(s)...", len(commands))
+        
+        if self._batch_supported:
+            command_outputs = self._run_batch(child, commands)
+            if command_outputs is not None:
+                return command_outputs
+            
+            # Stay in single-command mode until the next login
+            logging.warning("Batched ONT commands failed, falling back to one command at a time")
+            self._batch_supported = False
+            self._drain(child)
+        
+        return {cmd: self._run_single_command(child, cmd) for cmd in commands}
+    
+    def _run_batch(self, child, commands) -> Optional[Dict[str, str]]:
+        """Send all commands in one go, separated by echoed markers, and split the transcript
+        
+        Returns None when the markers do not come back, e.g. if the shell rejects echo.
+        """
+        try:
+            markers = [f"echo ===MARK_{i}===" for i in range(len(commands))]
+            batch = '\n'.join(f"{cmd}\n{marker}" for cmd, marker in zip(commands, markers))
+            child.sendline(batch)
+            
+            last = len(commands) - 1
+            last_marker = re.compile(rb'(?<!echo )===MARK_%d===' % last)
+            i = child.expect_list([last_marker, pexpect.TIMEOUT], timeout=30)
+            if i != 0:
+                logging.error("Timed out waiting for batched ONT command output")
+                return None
+            # Split and clean as bytes; each command's output is decoded once at the end
+            transcript = child.before + child.after
+            
+            # Consume the prompt after the last marker so the session is in sync
+            child.expect_list(_ONT_PROMPT_PATTERNS, timeout=10)
+        except pexpect.EOF:
+            logging.error("ONT session closed while running batched commands")
+            return None
         
-        # Essential commands for ONT monitoring
-        commands = [
-            'sfp info',              # Basic SFP module details
-            'onu dump ptp',          # PTP timing info including vendor ID
-            'onu show pon counter',  # FEC counters (at the end of output)
-            'onu show ponlink',      # PON link status
-            'onu show pon serdes',   # SerDes state
-            'sysmon cpu',            # CPU usage
-            'sysmon memory'          # Memory usage
-        ]
+        # Every line we typed may come back echoed; drop them with one set lookup per line
+        echoed = frozenset(line.encode() for line in (*commands, *markers))
+        command_outputs = {}
+        start = 0
+        for match in _MARKER_RE.finditer(transcript):
+            index = int(match.group(1))
+            if index < len(commands):
+                command_outputs[commands[index]] = self._clean_batch_output(transcript[start:match.start()], echoed)
+            start = match.end()
         
-        logging.info("Collecting ONT module information...")
+        if len(command_outputs) != len(commands):
+            logging.error(f"Batched ONT output had {len(command_outputs)} of {len(commands)} markers")
+            return None
         
+        # Re-run any command that came back empty on its own, with retries
         for cmd in commands:
-            try:
-                # Try up to 3 times for each command
-                max_retries = 3
-                retry_delay = 1.0  # Initial delay in seconds
+            if len(command_outputs[cmd]) < 10:
+                logging.warning(f"Command '{cmd}' returned empty/short output in batch, re-running it")
+                command_outputs[cmd] = self._run_single_command(child, cmd)
+            logging.debug("Command '%s' output length: %d", cmd, len(command_outputs[cmd]))
+        
+        return command_outputs
+    
+    @staticmethod
+    def _clean_batch_output(output: bytes, echoed: frozenset) -> str:
+        """Strip prompts, echoed commands and marker echoes from one batch segment"""
+        lines = []
+        for line in output.split(b'\n'):
+            line = line.strip()
+            if line.startswith(_PROMPT_PREFIXES):
+                line = line.partition(b'#')[2].strip()
+            if not line or line in echoed or b'ZXOS11NPI' in line or line == b'[/] #':
+                continue
+            lines.append(line)
+        return b'\n'.join(lines).decode('utf-8', 'ignore')
+    
+    @staticmethod
+    def _drain(child):
+        """Discard any output already waiting on the session"""
+        try:
+            while True:
+                child.read_nonblocking(size=child.maxread, timeout=0.1)
+        except pexpect.TIMEOUT:
+            pass
+    
+    @staticmethod
+    def _clean_command_output(raw_output: Optional[bytes], cmd: str) -> str:
+        """Drop the echoed command, prompt lines and blank lines from raw command output"""
+        if not raw_output:
+            return ""
+        # The echoed command is a literal prefix (after the space following the prompt)
+        output = raw_output.lstrip()
+        echo = cmd.encode()
+        if output.startswith(echo):
+            output = output[len(echo):]
+        output = _RE_PROMPT_LINES.sub(b'', _RE_LINE_EDGES.sub(b'', output))
+        return output.decode('utf-8', 'ignore').strip()
+    
+    def _run_single_command(self, child, cmd: str) -> str:
+        """Run one command on the ONT module, retrying on timeout or short output"""
+        command_output = ""
+        try:
+            # Try up to 3 times for each command
+            max_retries = 3
+            retry_delay = 1.0  # Initial delay in seconds
+            
+            for attempt in range(max_retries):
+                if attempt:
+                    logging.info("Running command: %s (attempt %d/%d)", cmd, attempt + 1, max_retries)
+                else:
+                    logging.info("Running command: %s", cmd)
                 
-                for attempt in range(max_retries):
-                    logging.info(f"Running command: {cmd}" + (f" (attempt {attempt + 1}/{max_retries})" if attempt > 0 else ""))
-                    
-                    # Send the command - ensure cmd is str
-                    cmd_str: str = str(cmd)
-                    child.sendline(cmd_str)
-                    
-                    # Clear the buffer before capturing output
-                    time.sleep(0.5)
-                    
-                    # Wait for the prompt to return - use the actual prompt format
-                    i = child.expect([r'admin@ZXOS11NPI\s+\[/\]\s+#', r'ZXOS11NPI.*#', pexpect.TIMEOUT], timeout=10)
-                    if i == 2:  # timeout
-                        logging.error(f"Command '{cmd}' timed out")
-                        if attempt < max_retries - 1:
-                            wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                            logging.warning(f"Retrying in {wait_time:.1f}s...")
-                            time.sleep(wait_time)
-                            continue
-                        command_outputs[cmd] = ""
-                        break
-                    
-                    # Get the output - use before which contains everything up to the prompt
-                    raw_output = child.before
-                    if raw_output is None:
-                        full_output = ""
-                    else:
-                        try:
-                            full_output = raw_output.decode('utf-8', 'ignore')
-                        except (AttributeError, UnicodeDecodeError):
-                            full_output = str(raw_output)
-                    
-                    # Remove the command from the beginning of the output
-                    cmd_pattern = re.escape(cmd) + r'\s*\r?\n'
-                    output = re.sub(cmd_pattern, '', full_output, count=1)
-                    
-                    # Clean up the output - remove empty lines and prompt artifacts
-                    cleaned_output = '\n'.join([line.strip() for line in output.split('\n') 
-                                             if line.strip() and 'admin@' not in line and 'ZXOS11NPI' not in line])
-                    
-                    # Check if output is too short or just contains prompt
-                    if not cleaned_output or cleaned_output == '[/] #' or len(cleaned_output) < 10:
-                        if attempt < max_retries - 1:
-                            wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                            logging.warning(f"Command '{cmd}' returned empty/short output. Retrying in {wait_time:.1f}s...")
-                            time.sleep(wait_time)
-                            continue
-                    
-                    command_outputs[cmd] = cleaned_output
-                    logging.debug(f"Command '{cmd}' output length: {len(cleaned_output)}")
-                    if cleaned_output:
-                        logging.debug(f"Command '{cmd}' output: '{cleaned_output[:200]}...'")
-                    break  # Success - exit retry loop
+                # Send the command - ensure cmd is str
+                cmd_str: str = str(cmd)
+                child.sendline(cmd_str)
                 
-                time.sleep(0.5)  # Small delay between commands
+                # Wait for the prompt to return - use the actual prompt format
+                i = child.expect_list(_ONT_PROMPT_PATTERNS, timeout=10)
+                if i == 1:  # timeout
+                    logging.error(f"Command '{cmd}' timed out")
+                    if attempt < max_retries - 1:
+                        wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
+                        logging.warning(f"Retrying in {wait_time:.1f}s...")
+                        time.sleep(wait_time)
+                        continue
+                    command_output = ""
+                    break
                 
-            except Exception as e:
-                logging.error(f"Error running command '{cmd}': {str(e)}")
-                command_outputs[cmd] = ""
+                # Get the output - use before which contains everything up to the prompt
+                cleaned_output = self._clean_command_output(child.before, cmd)
+                
+                # Check if output is too short or just contains prompt
+                if not cleaned_output or cleaned_output == '[/] #' or len(cleaned_output) < 10:
+                    if attempt < max_retries - 1:
+                        wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
+                        logging.warning(f"Command '{cmd}' returned empty/short output. Retrying in {wait_time:.1f}s...")
+                        time.sleep(wait_time)
+                        continue
+                
+                command_output = cleaned_output
+                # Skip building the output preview when DEBUG is off (the production case)
+                if cleaned_output and logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Command '%s' output length: %d", cmd, len(cleaned_output))
+                    logging.debug("Command '%s' output: '%s...'", cmd, cleaned_output[:200])
+                break  # Success - exit retry loop
+            
+        except (pexpect.EOF, OSError):
+            # The session is gone; let session() drop it so the next cycle reconnects
+            logging.error(f"ONT session closed while running '{cmd}'")
+            raise
+        except Exception as e:
+            logging.error(f"Error running command '{cmd}': {str(e)}")
+            command_output = ""
         
-        return command_outputs
+        return command_output
+    
+    def _output_unchanged(self, cmd: str, output: str) -> bool:
+        """Whether output is identical to the last output fully parsed for cmd.
+        
+        The gauges already hold its values, so only the warnings it raised are
+        logged again; they repeat every cycle while the condition applies.
+        """
+        remembered = self._output_hashes.get(cmd)
+        if remembered is None or remembered[0] != hash(output):
+            return False
+        logging.debug("Output of '%s' unchanged, skipping parse", cmd)
+        for message in remembered[1]:
+            logging.warning(message)
+        return True
+    
+    def _remember_output(self, cmd: str, output: str, warnings: List[str]):
+        """Record output as fully parsed for cmd, with the warnings it raised"""
+        self._output_hashes[cmd] = (hash(output), tuple(warnings))
+    
+    def _set_gauge(self, metric: Any, value: float, **labels):
+        """Set the interface-labelled child of a gauge, skipping the write if the value is unchanged"""
+        key = (id(metric), tuple(labels.items()))
+        cached = self._gauge_cache.get(key)
+        if cached is None:
+            child = metric.labels(interface_name=self.interface_name, **labels)
+        else:
+            child, last_value = cached
+            if last_value == value:
+                return
+        child.set(value)
+        self._gauge_cache[key] = (child, value)
     
     def _process_sfp_metrics(self, command_outputs: Dict[str, str]):
         """Process SFP module metrics from command outputs"""
-        if 'sfp info' not in command_outputs:
+        sfp_output = command_outputs.get('sfp info')
+        if sfp_output is None:
             logging.warning("No 'sfp info' output available")
             return
         
-        sfp_output = command_outputs['sfp info']
-        interface_name = self.interface_name
-        
         # Only log raw output if it's empty or very short (for debugging)
         if not sfp_output or len(sfp_output) < 10:
             logging.warning(f"Raw SFP info output is empty or too short: '{sfp_output}'")
             return
+        if self._output_unchanged('sfp info', sfp_output):
+            return
         
-        # Parse SFP temperature - format: "temperature: 53.250C"
-        temp_match = re.search(r'temperature\s*:\s*([\d.-]+)\s*C', sfp_output, re.IGNORECASE)
-        if temp_match:
-            try:
-                temp = float(temp_match.group(1))
-                zaram_ont_metrics.ont_sfp_temperature.labels(interface_name=interface_name).set(temp)
-                # Only log temperature if it's high (potential issue)
-                if temp > 70:
-                    logging.warning(f"ONT SFP temperature high: {temp}°C")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing SFP temperature: {e}")
-        else:
-            logging.warning("Could not find temperature in SFP info output")
-        
-        # Parse SFP RX power - format: "rx optical power: 0.013mW (-18.697dBm) [average]"
-        rx_power_match = re.search(r'rx\s*optical\s*power\s*:\s*[\d.]+\s*mW\s*\(([\d.-]+)\s*dBm\)', sfp_output, re.IGNORECASE)
-        if rx_power_match:
-            try:
-                rx_power = float(rx_power_match.group(1))
-                zaram_ont_metrics.ont_sfp_rx_power.labels(interface_name=interface_name).set(rx_power)
-                # Only log RX power if it's outside normal range (potential issue)
-                if rx_power < -30 or rx_power > -8:
-                    logging.warning(f"ONT SFP RX power outside normal range: {rx_power} dBm")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing SFP RX power: {e}")
-        else:
-            logging.warning("Could not find RX power in SFP info output")
-        
-        # Parse SFP TX power - format: "tx output power: 4.785mW (6.799dBm)"
-        tx_power_match = re.search(r'tx\s*output\s*power\s*:\s*[\d.]+\s*mW\s*\(([\d.-]+)\s*dBm\)', sfp_output, re.IGNORECASE)
-        if tx_power_match:
-            try:
-                tx_power = float(tx_power_match.group(1))
-                zaram_ont_metrics.ont_sfp_tx_power.labels(interface_name=interface_name).set(tx_power)
-                # Only log TX power if it's outside normal range (potential issue)
-                if tx_power < 0 or tx_power > 10:
-                    logging.warning(f"ONT SFP TX power outside normal range: {tx_power} dBm")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing SFP TX power: {e}")
-        else:
-            logging.warning("Could not find TX power in SFP info output")
-        
-        # Parse SFP voltage - format: "supply voltage: 3.340V"
-        voltage_match = re.search(r'supply\s*voltage\s*:\s*([\d.]+)\s*V', sfp_output, re.IGNORECASE)
-        if voltage_match:
-            try:
-                voltage = float(voltage_match.group(1))
-                zaram_ont_metrics.ont_sfp_voltage.labels(interface_name=interface_name).set(voltage)
-                # Only log voltage if it's outside normal range (potential issue)
-                if voltage < 3.0 or voltage > 3.6:
-                    logging.warning(f"ONT SFP voltage outside normal range: {voltage}V")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing SFP voltage: {e}")
-        else:
-            logging.warning("Could not find voltage in SFP info output")
-        
-        # Parse SFP TX bias current - format: "tx bias current: 18.368mA"
-        bias_match = re.search(r'tx\s*bias\s*current\s*:\s*([\d.]+)\s*mA', sfp_output, re.IGNORECASE)
-        if bias_match:
+        # Single pass over the output; each match names the field it found
+        found = set()
+        failed = False
+        warnings = []
+        for match in _RE_SFP_ALL.finditer(sfp_output):
+            key = match.lastgroup
+            metric, description, convert, low, high, unit = _SFP_FIELDS[key]
             try:
-                bias = float(bias_match.group(1))
-                zaram_ont_metrics.ont_sfp_tx_bias_current.labels(interface_name=interface_name).set(bias)
-                # Only log bias current if it's outside normal range (potential issue)
-                if bias < 5 or bias > 30:
-                    logging.warning(f"ONT SFP TX bias current outside normal range: {bias} mA")
+                value = convert(match.group(key))
             except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing SFP TX bias current: {e}")
-        else:
-            logging.warning("Could not find bias current in SFP info output")
+                logging.error(f"Error parsing SFP {description}: {e}")
+                failed = True
+                continue
+            found.add(key)
+            self._set_gauge(metric, value)
+            # Only log values outside their normal range (potential issue)
+            if (low is not None and value < low) or (high is not None and value > high):
+                warnings.append(f"ONT SFP {description} outside normal range: {value}{unit}")
+                logging.warning(warnings[-1])
+            else:
+                logging.debug("ONT SFP %s: %s", description, match.group(key))
         
-        # Parse diagnostic type - format: "diagnostic monitoring type: 0x68"
-        diag_match = re.search(r'diagnostic\s*monitoring\s*type\s*:\s*(0x[0-9a-fA-F]+)', sfp_output, re.IGNORECASE)
-        if diag_match:
-            try:
-                diag_type = int(diag_match.group(1), 16)
-                zaram_ont_metrics.ont_sfp_diagnostic_type.labels(interface_name=interface_name).set(diag_type)
-                # Only log diagnostic type changes (not every time)
-                logging.debug(f"ONT SFP diagnostic type: {diag_match.group(1)}")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing SFP diagnostic type: {e}")
-        else:
-            logging.warning("Could not find diagnostic type in SFP info output")
+        for key, (_, description, *_) in _SFP_FIELDS.items():
+            if key not in found:
+                logging.warning(f"Could not find {description} in SFP info output")
+        # Incomplete output is parsed (and warned about) again next cycle
+        if not failed and len(found) == len(_SFP_FIELDS):
+            self._remember_output('sfp info', sfp_output, warnings)
     
     def _process_pon_metrics(self, command_outputs: Dict[str, str]):
         """Process PON-specific metrics"""
-        interface_name = self.interface_name
-        
-        # Process FEC statistics
-        if 'onu show pon counter' in command_outputs:
-            fec_output = command_outputs['onu show pon counter']
-            self._parse_fec_statistics(fec_output, interface_name)
+        # Process FEC statistics. Always parsed: the running total changes every
+        # cycle anyway, and the high-counter warnings should repeat while they apply
+        fec_output = command_outputs.get('onu show pon counter')
+        if fec_output is not None:
+            self._parse_fec_statistics(fec_output)
         
         # Process PON status (link status)
-        if 'onu show ponlink' in command_outputs:
-            status_output = command_outputs['onu show ponlink']
-            self._parse_pon_status(status_output, interface_name)
+        status_output = command_outputs.get('onu show ponlink')
+        if status_output is not None and not self._output_unchanged('onu show ponlink', status_output):
+            warnings = []
+            if self._parse_pon_status(status_output, warnings):
+                self._remember_output('onu show ponlink', status_output, warnings)
         
         # Process SerDes state (from separate command)
-        if 'onu show pon serdes' in command_outputs:
-            serdes_output = command_outputs['onu show pon serdes']
-            self._parse_serdes_state(serdes_output, interface_name)
+        serdes_output = command_outputs.get('onu show pon serdes')
+        if serdes_output is not None and not self._output_unchanged('onu show pon serdes', serdes_output):
+            warnings = []
+            if self._parse_serdes_state(serdes_output, warnings):
+                self._remember_output('onu show pon serdes', serdes_output, warnings)
     
-    def _parse_fec_statistics(self, fec_output: str, interface_name: str):
+    def _parse_fec_statistics(self, fec_output: str):
         """Parse FEC statistics from command output"""
         # Only log raw output if it's empty or very short (for debugging)
         if not fec_output or len(fec_output) < 10:
             logging.warning(f"Raw FEC statistics output is empty or too short: '{fec_output}'")
             return
         
-        # Parse corrected bytes - format: "Corrected byte(8-byte) : <number>"
-        corrected_bytes_match = re.search(r'Corrected byte\(8-byte\)\s*:\s*(\d+)', fec_output, re.IGNORECASE)
-        if corrected_bytes_match:
-            try:
-                corrected_bytes = int(corrected_bytes_match.group(1))
-                zaram_ont_metrics.ont_pon_fec_corrected_bytes.labels(interface_name=interface_name).set(corrected_bytes)
-                # Only log if there are significant corrections
-                if corrected_bytes > 1000:
-                    logging.warning(f"PON FEC corrected bytes high: {corrected_bytes}")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing FEC corrected bytes: {e}")
-        else:
-            logging.warning(f"Could not find corrected bytes in FEC output")
-        
-        # Parse corrected codewords - format: "Corrected code words(8-byte) : <number>"
-        corrected_codewords_match = re.search(r'Corrected code words\(8-byte\)\s*:\s*(\d+)', fec_output, re.IGNORECASE)
-        if corrected_codewords_match:
-            try:
-                corrected_codewords = int(corrected_codewords_match.group(1))
-                zaram_ont_metrics.ont_pon_fec_corrected_codewords.labels(interface_name=interface_name).set(corrected_codewords)
-                # Only log if there are significant corrections
-                if corrected_codewords > 100:
-                    logging.warning(f"PON FEC corrected codewords high: {corrected_codewords}")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing FEC corrected codewords: {e}")
-        else:
-            logging.warning(f"Could not find corrected codewords in FEC output")
-        
-        # Parse uncorrectable codewords - format: "Uncorrectable code words(8-byte) : <number>"
-        uncorrectable_match = re.search(r'Uncorrectable code words\(8-byte\)\s*:\s*(\d+)', fec_output, re.IGNORECASE)
-        if uncorrectable_match:
-            try:
-                uncorrectable = int(uncorrectable_match.group(1))
-                zaram_ont_metrics.ont_pon_fec_uncorrectable_codewords.labels(interface_name=interface_name).set(uncorrectable)
-                # Log any uncorrectable errors (these are always concerning)
-                if uncorrectable > 0:
-                    logging.warning(f"PON FEC uncorrectable codewords detected: {uncorrectable}")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing FEC uncorrectable codewords: {e}")
-        else:
-            logging.warning(f"Could not find uncorrectable codewords in FEC output")
-        
-        # Parse total codewords - format: "Total code words(8-byte) : <number>"
-        total_match = re.search(r'Total code words\(8-byte\)\s*:\s*(\d+)', fec_output, re.IGNORECASE)
-        if total_match:
-            try:
-                total = int(total_match.group(1))
-                zaram_ont_metrics.ont_pon_fec_total_codewords.labels(interface_name=interface_name).set(total)
-                # Only log total codewords in debug mode
-                logging.debug(f"PON FEC total codewords: {total}")
-            except (ValueError, TypeError) as e:
-                logging.error(f"Error parsing FEC total codewords: {e}")
-        else:
-            logging.warning(f"Could not find total codewords in FEC output")
+        # All four counters in one search; fall back to the per-field patterns
+        # only if the block is incomplete or in an unexpected order
+        fec_match = _RE_FEC.search(fec_output)
+        for group, pattern, metric, description, threshold in _FEC_FIELDS:
+            raw_value = fec_match.group(group) if fec_match else None
+            if raw_value is None:
+                field_match = pattern.search(fec_output)
+                if not field_match:
+                    logging.warning(f"Could not find {description} in FEC output")
+                    continue
+                raw_value = field_match.group(1)
+            
+            value = int(raw_value)
+            self._set_gauge(metric, value)
+            # Only log counters above their threshold (potential issue)
+            if threshold is not None and value > threshold:
+                logging.warning(f"PON FEC {description} high: {value}")
+            else:
+                logging.debug("PON FEC %s: %s", description, value)
     
-    def _parse_pon_status(self, status_output: str, interface_name: str):
-        """Parse PON status from command output"""
+    def _parse_pon_status(self, status_output: str, warnings: List[str]) -> bool:
+        """Parse PON status from command output, returning whether the link status was set"""
         # Only log raw output if it's empty or very short (for debugging)
         if not status_output or len(status_output) < 10:
             logging.warning(f"Raw PON link status output is empty or too short: '{status_output}'")
-            return
+            return False
         
-        # Parse PON link status - handle the actual output format
-        # Output format: "ponlink-status : connect-OK" or similar
-        link_match = re.search(r'ponlink-status\s*:\s*(connect-OK|connect-FAIL|disconnect)', status_output, re.IGNORECASE)
+        # Parse PON link status - format: "ponlink-status : connect-OK"; older
+        # firmware variants report "link status : up" and similar
+        link_match = _RE_PON_LINK.search(status_output) or _RE_PON_LINK_LEGACY.search(status_output)
         if link_match:
-            status_text = link_match.group(1).lower()
-            link_status = 1 if 'connect-ok' in status_text else 0
-            zaram_ont_metrics.ont_pon_link_status.labels(interface_name=interface_name).set(link_status)
+            status_text = link_match.group('val').lower()
+            link_status = _PON_LINK_STATES.get(status_text, 0)
+            self._set_gauge(zaram_ont_metrics.ont_pon_link_status, link_status)
             # Only log if link is down (issue)
             if not link_status:
-                logging.warning(f"PON link status: DOWN ({status_text})")
-        else:
-            # Try a more flexible pattern that handles the exact format we see
-            link_match = re.search(r'ponlink-status\s*:\s*([^\s]+)', status_output, re.IGNORECASE)
-            if link_match:
-                status_text = link_match.group(1).lower()
-                link_status = 1 if 'connect-ok' in status_text else 0
-                zaram_ont_metrics.ont_pon_link_status.labels(interface_name=interface_name).set(link_status)
-                # Only log if link is down (issue)
-                if not link_status:
-                    logging.warning(f"PON link status: DOWN ({status_text})")
-            else:
-                # Fallback to original patterns
-                link_match = re.search(r'link\s*status\s*:\s*(up|down)', status_output, re.IGNORECASE)
-                if link_match:
-                    link_status = 1 if link_match.group(1).lower() == 'up' else 0
-                    zaram_ont_metrics.ont_pon_link_status.labels(interface_name=interface_name).set(link_status)
-                    # Only log if link is down (issue)
-                    if not link_status:
-                        logging.warning(f"PON link status: DOWN")
-                else:
-                    logging.warning(f"Could not find PON link status in output: '{status_output}'")
-                    # Try alternative patterns
-                    alt_patterns = [
-                        r'status\s*:\s*(up|down)',
-                        r'link\s*:\s*(up|down)',
-                        r'pon\s*status\s*:\s*(up|down)',
-                        r'connection\s*:\s*(up|down)'
-                    ]
-                    for pattern in alt_patterns:
-                        alt_match = re.search(pattern, status_output, re.IGNORECASE)
-                        if alt_match:
-                            link_status = 1 if alt_match.group(1).lower() == 'up' else 0
-                            zaram_ont_metrics.ont_pon_link_status.labels(interface_name=interface_name).set(link_status)
-                            # Only log if link is down (issue)
-                            if not link_status:
-                                logging.warning(f"PON link status (alt pattern): DOWN")
-                            break
-    
-    def _parse_serdes_state(self, serdes_output: str, interface_name: str):
-        """Parse SerDes state from command output"""
+                unknown = '' if status_text in _PON_LINK_STATES else ', unrecognised value'
+                warnings.append(f"PON link status: DOWN ({status_text}{unknown})")
+                logging.warning(warnings[-1])
+            return True
+        logging.warning(f"Could not find PON link status in output: '{status_output}'")
+        return False
+    
+    def _parse_serdes_state(self, serdes_output: str, warnings: List[str]) -> bool:
+        """Parse SerDes state from command output, returning whether the state was set"""
         # Parse SerDes state - format: "Serdes state | Very good(0x3e)"
-        serdes_match = re.search(r'Serdes\s*state\s*\|\s*([\w\s]+)\((0x[0-9a-fA-F]+)\)', serdes_output, re.IGNORECASE)
+        serdes_match = _RE_SERDES.search(serdes_output)
         if serdes_match:
             try:
                 serdes_text = serdes_match.group(1).strip()
                 serdes_hex = serdes_match.group(2)
-                serdes_value = int(serdes_hex, 16)
+                serdes_value = _hex_to_int(serdes_hex)
                 
                 # Set the numeric state value
-                zaram_ont_metrics.ont_pon_serdes_state.labels(interface_name=interface_name).set(serdes_value)
+                self._set_gauge(zaram_ont_metrics.ont_pon_serdes_state, serdes_value)
                 
-                # Set the text state as a gauge with value 1 for current state
-                possible_states = ["Very good", "Good", "Poor", "Error", "Failed", "Unknown"]
-                for state in possible_states:
-                    value = 1 if state == serdes_text else 0
-                    zaram_ont_metrics.ont_pon_serdes_text_state.labels(interface_name=interface_name, state=state).set(value)
+                # Set the text state as a gauge with value 1 for current state; the
+                # series only need touching when the state changes
+                if serdes_text != self._last_serdes_text:
+                    for state in _SERDES_TEXT_STATES:
+                        value = 1 if state == serdes_text else 0
+                        self._set_gauge(zaram_ont_metrics.ont_pon_serdes_text_state, value, state=state)
+                    self._last_serdes_text = serdes_text
                 
                 # Only log if SerDes state indicates an issue
                 if 'error' in serdes_text.lower() or 'fail' in serdes_text.lower():
-                    logging.warning(f"PON SerDes state indicates issue: {serdes_text} ({serdes_hex})")
+                    warnings.append(f"PON SerDes state indicates issue: {serdes_text} ({serdes_hex})")
+                    logging.warning(warnings[-1])
+                return True
             except (ValueError, TypeError) as e:
                 logging.error(f"Error parsing SerDes state: {e}")
         else:
             logging.warning(f"Could not find SerDes state in output: '{serdes_output}')")
-    
-    def _get_serdes_state_description(self, serdes_value: int) -> str:
-        """Get human-readable description of SerDes state"""
-        serdes_states = {
-            0x00: "Reset",
-            0x01: "Initializing",
-            0x02: "Ready",
-            0x03: "Active",
-            0x04: "Error",
-            0x05: "Disconnected"
-        }
-        return serdes_states.get(serdes_value, f"Unknown (0x{serdes_value:02x})")
+        return False
     
     def _process_system_metrics(self, command_outputs: Dict[str, str]):
         """Process system metrics (CPU, memory)"""
-        interface_name = self.interface_name
-        
         # Process CPU usage
-        if 'sysmon cpu' in command_outputs:
-            cpu_output = command_outputs['sysmon cpu']
-            cpu_match = re.search(r'cpu\s*usage\s*:\s*([\d.]+)\s*%', cpu_output, re.IGNORECASE)
+        cpu_output = command_outputs.get('sysmon cpu')
+        if cpu_output is not None and not self._output_unchanged('sysmon cpu', cpu_output):
+            cpu_match = _RE_CPU.search(cpu_output)
             if cpu_match:
                 try:
                     cpu_usage = float(cpu_match.group(1))
-                    zaram_ont_metrics.ont_cpu_usage.labels(interface_name=interface_name).set(cpu_usage)
+                    self._set_gauge(zaram_ont_metrics.ont_cpu_usage, cpu_usage)
                     # Only log if CPU usage is high (potential issue)
-                    if cpu_usage > 80:
-                        logging.warning(f"ONT CPU usage high: {cpu_usage}%")
+                    warnings = []
+                    if cpu_usage > _CPU_WARN_PERCENT:
+                        warnings.append(f"ONT CPU usage high: {cpu_usage}%")
+                        logging.warning(warnings[-1])
+                    self._remember_output('sysmon cpu', cpu_output, warnings)
                 except (ValueError, TypeError) as e:
                     logging.error(f"Error parsing CPU usage: {e}")
         
         # Process memory usage
-        if 'sysmon memory' in command_outputs:
-            mem_output = command_outputs['sysmon memory']
-            
-            mem_match = re.search(r'used/total\s*=\s*(\d+)/(\d+)\s*\(([\d.]+)\s*%\)', mem_output)
+        mem_output = command_outputs.get('sysmon memory')
+        if mem_output is None:
+            logging.warning("No 'sysmon memory' output available")
+        elif not self._output_unchanged('sysmon memory', mem_output):
+            mem_match = _RE_MEMORY.search(mem_output)
             if mem_match:
                 try:
                     used = int(mem_match.group(1))
                     total = int(mem_match.group(2))
                     percent = float(mem_match.group(3))
                     
-                    zaram_ont_metrics.ont_memory_used.labels(interface_name=interface_name).set(used)
-                    zaram_ont_metrics.ont_memory_total.labels(interface_name=interface_name).set(total)
-                    zaram_ont_metrics.ont_memory_usage.labels(interface_name=interface_name).set(percent)
+                    self._set_gauge(zaram_ont_metrics.ont_memory_used, used)
+                    self._set_gauge(zaram_ont_metrics.ont_memory_total, total)
+                    self._set_gauge(zaram_ont_metrics.ont_memory_usage, percent)
                     
                     # Only log if memory usage is high (potential issue)
-                    if percent > 85:
-                        logging.warning(f"ONT memory usage high: {used}/{total} bytes ({percent}%)")
+                    warnings = []
+                    if percent > _MEMORY_WARN_PERCENT:
+                        warnings.append(f"ONT memory usage high: {used}/{total} bytes ({percent}%)")
+                        logging.warning(warnings[-1])
+                    self._remember_output('sysmon memory', mem_output, warnings)
                 except (ValueError, TypeError) as e:
                     logging.error(f"Error parsing memory usage: {e}")
             else:
                 logging.warning(f"Memory output did not match expected pattern. Output: '{mem_output}'")
-        else:
-            logging.warning("No 'sysmon memory' output available")
     
     def _process_olt_info(self, command_outputs: Dict[str, str]) -> None:
         """Process OLT vendor information"""
-        if 'onu dump ptp' not in command_outputs:
+        output = command_outputs.get('onu dump ptp')
+        if output is None:
             self.logger.warning("No 'onu dump ptp' output available")
             return
-
-        output = command_outputs['onu dump ptp']
         
         # Log raw output for debugging if it's empty or very short
         if not output or len(output) < 10:
             self.logger.warning(f"Raw OLT vendor info output is empty or too short: '{output}'")
             return
         else:
-            self.logger.debug(f"Raw OLT vendor info output: {output}")
+            self.logger.debug("Raw OLT vendor info output: %s", output)
         
         try:
-            # Extract vendor ID and version
-            vendor_id = self._extract_olt_vendor_id(output)
-            if vendor_id:
-                vendor_name = self._get_vendor_name(vendor_id)
-                zaram_ont_metrics.ont_olt_vendor_id.labels(
-                    interface_name=self.interface_name,
-                    vendor_name=vendor_name
-                ).set(vendor_id)
+            # Extract vendor ID and version; the first occurrence of each wins
+            fields = {}
+            for match in _RE_OLT_INFO.finditer(output):
+                fields.setdefault(match.lastgroup, match.group(match.lastgroup))
             
-            # Extract version
-            version_match = re.search(r'version\s*:\s*([0-9a-fA-F]+)', output, re.IGNORECASE)
-            if version_match:
-                version = version_match.group(1)
-                zaram_ont_metrics.ont_olt_version.labels(
-                    interface_name=self.interface_name,
-                    version=version
-                ).set(1)  # Using 1 as the value since we're using the label for the actual version
+            vendor_hex = fields.get('raw') or fields.get('prefixed')
+            vendor_id = vendor_name = None
+            if vendor_hex:
+                vendor_id = _hex_to_int(vendor_hex)
+                vendor_name = self._vendor_table.get(vendor_id, "Unknown")
+            # The OLT rarely changes; only touch the gauge when it does
+            if vendor_id and vendor_id != self.last_vendor_id:
+                self._set_gauge(zaram_ont_metrics.ont_olt_vendor_id, vendor_id, vendor_name=vendor_name)
+                if self.last_vendor_id is not None:
+                    self.logger.info(f"OLT vendor changed: {self.last_vendor_name} -> {vendor_name}")
+                self.last_vendor_id = vendor_id
+                self.last_vendor_name = vendor_name
+            
+            version = fields.get('version')
+            if version:
+                if version != self.last_olt_version:
+                    # Using 1 as the value since we're using the label for the actual version
+                    self._set_gauge(zaram_ont_metrics.ont_olt_version, 1, version=version)
+                    self.last_olt_version = version
             else:
                 self.logger.warning("Could not find OLT version in output")
             
+            if vendor_id:
+                self._olt_info_collected_at = time.monotonic()
+            
         except Exception as e:
             self.logger.error(f"Error processing OLT vendor information: {str(e)}")
             raise
-
-    def _extract_olt_vendor_id(self, output):
-        """Extract OLT vendor ID from onu dump ptp output"""
-        try:
-            # Look for vendor ID in OLT-G section
-            vendor_match = re.search(r'oltVendorId\s*:\s*([0-9a-fA-F]+)', output, re.IGNORECASE)
-            if vendor_match:
-                return int(vendor_match.group(1), 16)  # Convert hex to decimal
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting OLT vendor ID: {str(e)}")
-            return None
-
-    def _get_vendor_name(self, vendor_id):
-        """Get vendor name from vendor ID"""
-        # Convert decimal vendor_id back to hex string format
-        hex_id = f"0x{vendor_id:08x}"
-        return self.olt_vendor_map.get(hex_id, "Unknown")
-
-    def _connect_and_collect_regular(self) -> Optional[Dict[str, str]]:
-        """Connect to the ONT module and collect regular command outputs (excluding OLT vendor)"""
-        try:
-            logging.info(f"Connecting to {self.ssh_user}@{self.ssh_host}...")
-            child = pexpect.spawn(f'ssh {self.ssh_user}@{self.ssh_host}')
-            
-            # Handle SSH password prompt if needed (should use SSH keys)
-            i = child.expect(['password:', pexpect.EOF, pexpect.TIMEOUT], timeout=5)
-            if i == 0:  # password prompt
-                logging.info("SSH password required, using SSH key authentication")
-                # If we get here, SSH key authentication failed
-                child.close()
-                return None
-            
-            # Wait for router prompt
-            i = child.expect([r'\[.*\] >', pexpect.TIMEOUT], timeout=10)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get router prompt")
-                child.close()
-                return None
-                
-            logging.info("Connected to RouterOS")
-            
-            # Start telnet to SFP
-            logging.info(f"Starting telnet to {self.zaram_ont_ip}...")
-            child.sendline(f'/system telnet {self.zaram_ont_ip}')
-            
-            # Handle telnet login
-            i = child.expect(['login:', 'Connection refused', pexpect.TIMEOUT], timeout=10)
-            if i != 0:  # not login prompt
-                error_msg = child.before.decode('utf-8', 'ignore') if child.before else 'None'
-                logging.error(f"Failed to get login prompt. Got: {error_msg}")
-                child.close()
-                return None
-                
-            logging.info("Sending username...")
-            child.sendline(self.zaram_ont_user)
-            
-            i = child.expect(['Password:', pexpect.TIMEOUT], timeout=5)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get password prompt")
-                child.close()
-                return None
-                
-            logging.info("Sending password...")
-            if not self.zaram_ont_password:
-                logging.error("Zaram ONT password is None")
-                child.close()
-                return None
-            password: str = self.zaram_ont_password  # Type assertion
-            child.sendline(password)
-            
-            # Look for command prompt
-            i = child.expect(['ZXOS11NPI', pexpect.TIMEOUT], timeout=5)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get SFP module prompt")
-                child.close()
-                return None
-                
-            logging.info("Successfully logged in to SFP module")
-            
-            # Run regular commands and collect outputs (excluding OLT vendor)
-            command_outputs = self._run_regular_commands(child)
-            
-            # Exit telnet and close connection
-            child.sendline('exit')  # exit telnet
-            child.expect(r'\[.*\] >', timeout=5)
-            child.sendline('quit')  # exit SSH
-            child.close()
-            
-            return command_outputs
-            
-        except Exception as e:
-            logging.error(f"Error in _connect_and_collect_regular: {str(e)}", exc_info=True)
-            try:
-                if 'child' in locals():
-                    child.close()
-            except:
-                pass
-            return None
-
-    def _connect_and_collect_olt_vendor(self) -> Optional[Dict[str, str]]:
-        """Connect to the ONT module and collect only OLT vendor command outputs"""
-        try:
-            logging.info(f"Connecting to {self.ssh_user}@{self.ssh_host}...")
-            child = pexpect.spawn(f'ssh {self.ssh_user}@{self.ssh_host}')
-            
-            # Handle SSH password prompt if needed (should use SSH keys)
-            i = child.expect(['password:', pexpect.EOF, pexpect.TIMEOUT], timeout=5)
-            if i == 0:  # password prompt
-                logging.info("SSH password required, using SSH key authentication")
-                # If we get here, SSH key authentication failed
-                child.close()
-                return None
-            
-            # Wait for router prompt
-            i = child.expect([r'\[.*\] >', pexpect.TIMEOUT], timeout=10)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get router prompt")
-                child.close()
-                return None
-                
-            logging.info("Connected to RouterOS")
-            
-            # Start telnet to SFP
-            logging.info(f"Starting telnet to {self.zaram_ont_ip}...")
-            child.sendline(f'/system telnet {self.zaram_ont_ip}')
-            
-            # Handle telnet login
-            i = child.expect(['login:', 'Connection refused', pexpect.TIMEOUT], timeout=10)
-            if i != 0:  # not login prompt
-                error_msg = child.before.decode('utf-8', 'ignore') if child.before else 'None'
-                logging.error(f"Failed to get login prompt. Got: {error_msg}")
-                child.close()
-                return None
-                
-            logging.info("Sending username...")
-            child.sendline(self.zaram_ont_user)
-            
-            i = child.expect(['Password:', pexpect.TIMEOUT], timeout=5)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get password prompt")
-                child.close()
-                return None
-                
-            logging.info("Sending password...")
-            if not self.zaram_ont_password:
-                logging.error("Zaram ONT password is None")
-                child.close()
-                return None
-            password: str = self.zaram_ont_password  # Type assertion
-            child.sendline(password)
-            
-            # Look for command prompt
-            i = child.expect(['ZXOS11NPI', pexpect.TIMEOUT], timeout=5)
-            if i != 0:  # timeout or other error
-                logging.error("Failed to get SFP module prompt")
-                child.close()
-                return None
-                
-            logging.info("Successfully logged in to SFP module")
-            
-            # Run only OLT vendor command and collect output
-            command_outputs = self._run_olt_vendor_command(child)
-            
-            # Exit telnet and close connection
-            child.sendline('exit')  # exit telnet
-            child.expect(r'\[.*\] >', timeout=5)
-            child.sendline('quit')  # exit SSH
-            child.close()
-            
-            return command_outputs
-            
-        except Exception as e:
-            logging.error(f"Error in _connect_and_collect_olt_vendor: {str(e)}", exc_info=True)
-            try:
-                if 'child' in locals():
-                    child.close()
-            except:
-                pass
-            return None
-
-    def _run_regular_commands(self, child) -> Dict[str, str]:
-        """Run regular commands on the ONT module (excluding OLT vendor) and return outputs"""
-        command_outputs = {}
-        
-        # Regular commands for ONT monitoring (excluding OLT vendor)
-        commands = [
-            'sfp info',              # Basic SFP module details
-            'onu show pon counter',  # FEC counters (at the end of output)
-            'onu show ponlink',      # PON link status
-            'onu show pon serdes',   # SerDes state
-            'sysmon cpu',            # CPU usage
-            'sysmon memory'          # Memory usage
-        ]
-        
-        logging.info("Collecting ONT module regular information...")
-        
-        for cmd in commands:
-            try:
-                logging.info(f"Running command: {cmd}")
-                
-                # Send the command
-                child.sendline(cmd)
-                
-                # Clear the buffer before capturing output
-                time.sleep(0.5)
-                
-                # Wait for the prompt to return - use the actual prompt format
-                i = child.expect([r'admin@ZXOS11NPI\s+\[/\]\s+#', r'ZXOS11NPI.*#', pexpect.TIMEOUT], timeout=10)
-                if i == 2:  # timeout
-                    logging.error(f"Command '{cmd}' timed out")
-                    command_outputs[cmd] = ""
-                else:
-                    # Get the output - use before which contains everything up to the prompt
-                    output = child.before.decode('utf-8', 'ignore')
-                    # Remove the command from the output
-                    output = output.replace(cmd, '').strip()
-                    command_outputs[cmd] = output
-                
-                # Add a small delay between commands
-                time.sleep(1)
-                
-            except Exception as e:
-                logging.error(f"Error running command '{cmd}': {str(e)}")
-                command_outputs[cmd] = ""
-                
-        return command_outputs
-
-    def _run_olt_vendor_command(self, child) -> Dict[str, str]:
-        """Run only OLT vendor command on the ONT module and return output"""
-        command_outputs = {}
-        
-        # Only OLT vendor command
-        commands = [
-            'onu dump ptp'          # PTP timing info including vendor ID
-        ]
-        
-        logging.info("Collecting OLT vendor information...")
-        
-        for cmd in commands:
-            try:
-                logging.info(f"Running command: {cmd}")
-                
-                # Send the command
-                child.sendline(cmd)
-                
-                # Clear the buffer before capturing output
-                time.sleep(0.5)
-                
-                # Wait for the prompt to return - use the actual prompt format
-                i = child.expect([r'admin@ZXOS11NPI\s+\[/\]\s+#', r'ZXOS11NPI.*#', pexpect.TIMEOUT], timeout=10)
-                if i == 2:  # timeout
-                    logging.error(f"Command '{cmd}' timed out")
-                    command_outputs[cmd] = ""
-                else:
-                    # Get the output - use before which contains everything up to the prompt
-                    full_output = child.before.decode('utf-8', 'ignore') if child.before else ""
-                    
-                    # Remove the command from the beginning of the output
-                    cmd_pattern = re.escape(cmd) + r'\s*\r?\n'
-                    output = re.sub(cmd_pattern, '', full_output, count=1)
-                    
-                    # Clean up the output - remove empty lines and prompt artifacts
-                    cleaned_output = '\n'.join([line.strip() for line in output.split('\n') 
-                                             if line.strip() and 'admin@' not in line and 'ZXOS11NPI' not in line])
-                    command_outputs[cmd] = cleaned_output
-                    
-                    logging.debug(f"Command '{cmd}' output length: {len(cleaned_output)}")
-                    if cleaned_output:
-                        logging.debug(f"Command '{cmd}' output: '{cleaned_output[:200]}...'")
-                
-                time.sleep(0.5)  # Small delay between commands
-                
-            except Exception as e:
-                logging.error(f"Error running command '{cmd}': {str(e)}")
-                command_outputs[cmd] = ""
-        
-        return command_outputs 
\ No newline at end of file